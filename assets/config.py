@@ -2,11 +2,48 @@
 
 # Data base bath
 DB_PATH = "data/shared_data.db"
+DB_BUSY_TIMEOUT_MS: int = 5000
+DB_CACHED_STATEMENTS: int = 64
+
+# How often the state store checks the database for external writes (ms)
+STATE_POLL_INTERVAL_MS: int = 50
+
+# Command server: "asyncio" serves every controller from one event loop
+# thread, "thread" starts one OS thread per controller
+SERVER_MODE: str = "asyncio"
+SERVER_BACKLOG: int = 128
+# Acks buffered per controller before its reads pause (bytes)
+SERVER_WRITE_BUFFER_BYTES: int = 64 * 1024
+# Largest framed request accepted from a controller (bytes)
+SERVER_MAX_FRAME_BYTES: int = 64 * 1024
+
+# Decoded advertising frames kept ready ahead of the render thread
+VIDEO_BUFFER_FRAMES: int = 32
+
+# Drift between the audio position and the video clock tolerated before the
+# video clock is realigned to the audio (ms)
+AV_SYNC_TOLERANCE_MS: int = 40
+
+# Sync mode of the counter store commits, FULL keeps the spin counter
+# through a power loss at the cost of one fsync per spin
+COUNTER_SYNCHRONOUS: str = "FULL"
+
+# Spin ledger group commit: rows per transaction and max wait for a group (ms)
+LEDGER_BATCH_SIZE: int = 256
+LEDGER_COMMIT_INTERVAL_MS: int = 200
 
 # Paths of advertising interface
 ADVERTISING_IMAGE_PATH: str = "assets/images/advertising/"
 ADVERTISING_VIDEO_PATH: str = "assets/videos/"
 ADVERTISING_AUDIO_PATH: str = "assets/audio/advertising/"
+ADVERTISING_CACHE_PATH: str = "assets/cache/"
+ADVERTISING_VIDEO_SIZE: tuple[int, int] = (576, 720)
+# Clip weights and scheduling windows, kept next to the videos
+ADVERTISING_PLAYLIST_FILE: str = "playlist.json"
+# Seconds between two scans of the video directory for new clips
+ADVERTISING_WATCH_INTERVAL_S: float = 5
+# Longest delay before retrying clips that failed to bake (s)
+ADVERTISING_INGEST_RETRY_MAX_S: float = 300
 
 # Paths of slot machine interface
 SLOT_MACHINE_IMAGE_PATH: str = "assets/images/slot_machine/"
@@ -35,3 +72,24 @@ LINE_WIDHT: int = 4
 
 #
 FPS: int = 120
+
+# Frame rate caps of the main loop per interface, it only runs that fast
+# while something moves on screen and otherwise waits for events
+ADVERTISING_MAX_FPS: int = 60
+SLOT_MACHINE_MAX_FPS: int = FPS
+# Longest time the idle main loop waits for an event before checking again (ms)
+IDLE_WAKEUP_MS: int = 1000
+
+# Symbols advanced per second by a spinning reel
+SPIN_STEPS_PER_SECOND: int = 24
+
+# Memory cap of the shared gradient cache (bytes)
+GRADIENT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+# Memory kept by loaded assets no interface is using (bytes)
+ASSET_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+# Per-stage frame timing, also switched on at runtime with the "timing on"
+# command, and the samples kept per stage
+FRAME_TIMING_ENABLED: bool = False
+FRAME_TIMING_WINDOW: int = 600
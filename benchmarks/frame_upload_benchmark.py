@@ -0,0 +1,94 @@
+"""Frame upload benchmark for advertising playback.
+
+Compares ways of getting a decoded RGB frame (a NumPy array) onto the
+screen: frame rate and bytes allocated per frame, under SDL's dummy video
+driver.
+
+Run from the repository root:
+
+    python -m benchmarks.frame_upload_benchmark --frames 500
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from assets.config import ADVERTISING_VIDEO_SIZE
+from logic.frame_upload import FrameUploader
+
+
+def upload_copy(frame: np.ndarray, state: dict) -> pygame.Surface:
+    """Previous path: copy the frame to bytes and wrap it in a new surface."""
+    return pygame.image.frombuffer(frame.tobytes(), frame.shape[1::-1], "RGB")
+
+
+def upload_in_place(frame: np.ndarray, state: dict) -> pygame.Surface:
+    """Current path: write the frame into a persistent surface."""
+    return state["uploader"].upload(frame)
+
+
+METHODS = {"tobytes_frombuffer": upload_copy, "persistent_surface": upload_in_place}
+
+
+def measure(method, frames: list[np.ndarray], screen: pygame.Surface) -> dict:
+    """Upload and blit every frame, returning frame rate and allocations."""
+    state = {"uploader": FrameUploader()}
+    method(frames[0], state)  # Warm up, creates the persistent surface
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    allocated = 0
+    for frame in frames:
+        snapshot, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        surface = method(frame, state)
+        screen.blit(surface, (0, 0))
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += max(0, peak - snapshot)
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    return {
+        "fps": len(frames) / elapsed,
+        "ms_per_frame": elapsed * 1000 / len(frames),
+        "allocated_bytes_per_frame": allocated / len(frames),
+        "frame_bytes": frames[0].nbytes,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--output", default="bench_results/frame_upload_benchmark.json")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1920, 1080))
+    width, height = ADVERTISING_VIDEO_SIZE
+    rng = np.random.default_rng(0)
+    frames = [
+        rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(8)
+    ]
+    frames = [frames[i % len(frames)] for i in range(args.frames)]
+
+    report = {name: measure(method, frames, screen) for name, method in METHODS.items()}
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    for name, result in report.items():
+        print(
+            f"{name}: {result['fps']:.0f} fps, {result['ms_per_frame']:.2f} ms/frame, "
+            f"{result['allocated_bytes_per_frame'] / 1024:.1f} KiB allocated/frame"
+        )
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""Headless render benchmark for the kiosk interfaces.
+
+Runs the initial screen, advertising playback and the slot machine (idle and
+scripted spins) under SDL's dummy video and audio drivers at several
+resolutions, and reports frame time percentiles and bytes allocated per
+frame. Advertising plays a synthetic clip and the game writes to a
+temporary database, so the kiosk's cache and data are left untouched.
+
+Run from the repository root:
+
+    python -m benchmarks.render_benchmark --resolutions 1280x720 1920x1080
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+import data.counter_store
+import data.data_base
+import data.spin_ledger
+import logic.playlist
+from assets.config import ADVERTISING_VIDEO_SIZE
+from data.counter_store import get_counter_store
+from data.spin_ledger import get_spin_ledger
+from data.state_store import get_state_store
+from interfaces.init import Init
+from logic.frame_store import write_frame_store
+from logic.manage_interface import InterfaceManager
+from logic.media_ingest import FRAMES_FILE, META_FILE, MediaCache
+from logic.stats import percentile
+
+RESOLUTIONS = ["1280x720", "1920x1080", "3840x2160"]
+
+
+class FrameClock:
+    """Stand-in for pygame.time.Clock that records the work done in each frame.
+
+    Every tick closes a frame: the time spent since the previous tick and,
+    while tracemalloc runs, the bytes allocated in it are recorded. Frames are
+    then paced to the requested rate like the scheduler's clock, so
+    time-driven animations (reels, video) see the same number of frames as
+    on the kiosk.
+    """
+
+    def __init__(self, allocations: bool = False) -> None:
+        self.allocations = allocations
+        self.frame_times: list[float] = []
+        self.frame_bytes: list[int] = []
+        self.start()
+
+    def start(self) -> None:
+        """Open the first frame."""
+        if self.allocations:
+            tracemalloc.reset_peak()
+            self.traced, _ = tracemalloc.get_traced_memory()
+        self.last = time.perf_counter()
+
+    def tick(self, framerate: int = 0) -> int:
+        work = time.perf_counter() - self.last
+        self.frame_times.append(work)
+        if self.allocations:
+            _, peak = tracemalloc.get_traced_memory()
+            self.frame_bytes.append(max(0, peak - self.traced))
+        if framerate and work < 1 / framerate:
+            time.sleep(1 / framerate - work)
+        self.start()
+        return int(work * 1000)
+
+    def summary(self) -> dict:
+        """Return frame time percentiles in milliseconds."""
+        times = sorted(sample * 1000 for sample in self.frame_times)
+        return {
+            "frames": len(times),
+            "mean_ms": sum(times) / len(times) if times else 0.0,
+            "p50_ms": percentile(times, 0.50),
+            "p95_ms": percentile(times, 0.95),
+            "p99_ms": percentile(times, 0.99),
+            "max_ms": times[-1] if times else 0.0,
+        }
+
+    def allocation_summary(self) -> dict:
+        """Return the bytes allocated per frame."""
+        sizes = sorted(self.frame_bytes)
+        return {
+            "alloc_mean_bytes": sum(sizes) / len(sizes) if sizes else 0.0,
+            "alloc_p95_bytes": percentile(sizes, 0.95),
+        }
+
+
+def measure(scenario, frames: int, allocation_frames: int) -> dict:
+    """Run a scenario once for timings and once under tracemalloc."""
+    clock = FrameClock()
+    scenario(clock, frames)
+    result = clock.summary()
+
+    tracemalloc.start()
+    clock = FrameClock(allocations=True)
+    scenario(clock, allocation_frames)
+    tracemalloc.stop()
+    result.update(clock.allocation_summary())
+    return result
+
+
+def make_synthetic_playlist(directory: str, seconds: float, fps: float) -> None:
+    """Bake a synthetic clip and make it the only one of the playlist."""
+    cache = MediaCache(
+        video_path=os.path.join(directory, "videos"),
+        cache_path=os.path.join(directory, "cache"),
+    )
+    content_hash = "0" * 64
+    entry = cache.entry_path(content_hash)
+    os.makedirs(entry)
+    width, height = ADVERTISING_VIDEO_SIZE
+    rng = np.random.default_rng(0)
+    images = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+    count = int(seconds * fps)
+    write_frame_store(
+        os.path.join(entry, FRAMES_FILE),
+        (images[i % len(images)] for i in range(count)),
+        ADVERTISING_VIDEO_SIZE,
+        fps,
+    )
+    with open(os.path.join(entry, META_FILE), "w") as file:
+        json.dump({"size": [width, height], "fps": fps, "frames": count}, file)
+    cache.index = {"synthetic.mp4": {"size": 0, "mtime": 0, "hash": content_hash}}
+    logic.playlist.playlist = logic.playlist.Playlist(cache)
+
+
+def run_resolution(size: tuple[int, int], args: argparse.Namespace) -> dict:
+    """Benchmark every interface at one resolution."""
+    screen = pygame.display.set_mode(size)
+    results = {}
+
+    init = Init.__new__(Init)  # Only its drawing, without the server and the loop
+    init.screen = screen
+    init.screen_width, init.screen_height = size
+    init.connection_established = False
+    init.setup_pygame_window()
+
+    def init_screen(clock: FrameClock, frames: int) -> None:
+        for _ in range(frames):
+            pygame.event.pump()
+            init.draw_initial_screen()
+            clock.tick(60)
+
+    results["init_screen"] = measure(init_screen, args.frames, args.allocation_frames)
+
+    manager = InterfaceManager(screen)
+    slot_machine = manager.slot_machine_interface
+    slot_machine.is_winner_attemp = lambda: False  # Scripted losing spins
+
+    # The frames are paced like the scheduler paces them while animating,
+    # an idle slot machine is drawn every frame to measure its cost
+    def advertising(clock: FrameClock, frames: int) -> None:
+        manager.switch_to(manager.advertising_interface)
+        for _ in range(frames):
+            pygame.event.pump()
+            manager.run()
+            clock.tick(manager.max_fps())
+
+    def slot_idle(clock: FrameClock, frames: int) -> None:
+        manager.switch_to(slot_machine)
+        for _ in range(frames):
+            pygame.event.pump()
+            manager.run()
+            clock.tick(manager.max_fps())
+
+    def slot_spin(clock: FrameClock, spins: int) -> None:
+        manager.switch_to(slot_machine)
+        for _ in range(spins):
+            slot_machine.spin_slots()
+            while manager.is_animating():
+                pygame.event.pump()
+                manager.run()
+                clock.tick(manager.max_fps())
+            slot_machine.show_loss_message = False
+
+    results["advertising"] = measure(advertising, args.frames, args.allocation_frames)
+    results["slot_idle"] = measure(slot_idle, args.frames, args.allocation_frames)
+    results["slot_spin"] = measure(slot_spin, args.spins, 1)
+
+    manager.stop()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resolutions", nargs="+", default=RESOLUTIONS)
+    parser.add_argument("--frames", type=int, default=300, help="per scenario")
+    parser.add_argument(
+        "--allocation-frames", type=int, default=120, help="frames under tracemalloc"
+    )
+    parser.add_argument("--spins", type=int, default=2, help="scripted spins")
+    parser.add_argument("--output", default="bench_results/render_benchmark.json")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="render_benchmark_")
+    # The game's state, counter and ledger go to a throwaway database
+    data.data_base.DB_PATH = data.spin_ledger.DB_PATH = data.counter_store.DB_PATH = (
+        os.path.join(workdir, "shared_data.db")
+    )
+    pygame.init()
+    make_synthetic_playlist(workdir, args.frames / 60 + 2, 25)
+
+    results = {}
+    try:
+        for resolution in args.resolutions:
+            width, height = (int(value) for value in resolution.split("x"))
+            results[resolution] = run_resolution((width, height), args)
+            for scenario, result in results[resolution].items():
+                print(
+                    f"{resolution} {scenario}: p50 {result['p50_ms']:.2f}ms "
+                    f"p95 {result['p95_ms']:.2f}ms p99 {result['p99_ms']:.2f}ms, "
+                    f"{result['alloc_mean_bytes'] / 1024:.1f} KiB allocated/frame"
+                )
+    finally:
+        logic.playlist.get_playlist().stop()
+        get_state_store().stop()
+        get_spin_ledger().stop()
+        get_counter_store().close()
+        pygame.quit()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "config": vars(args),
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Load generator and latency benchmark for the command server.
+
+Starts ServerSocket on localhost, drives it from a pool of synthetic
+controllers speaking the framed protocol and measures how long each command
+takes from being sent to being dispatched through process_command.
+
+Run from the repository root:
+
+    python -m benchmarks.server_benchmark --clients 50 --commands 2000
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import queue
+import shutil
+import tempfile
+import threading
+import time
+
+import data.data_base
+from logic.stats import histogram, percentile
+from server.protocol import encode_frame
+from server.server_socket import ServerSocket
+
+
+def summarize(samples_s: list[float]) -> dict:
+    """Build percentiles and a log-scale histogram from latencies in seconds."""
+    values = sorted(sample * 1e6 for sample in samples_s)
+    return {
+        "count": len(values),
+        "p50_us": percentile(values, 0.50),
+        "p90_us": percentile(values, 0.90),
+        "p99_us": percentile(values, 0.99),
+        "max_us": values[-1] if values else 0.0,
+        "histogram": histogram(values),
+    }
+
+
+class Dispatcher(threading.Thread):
+    """Thread that plays the main loop: takes queued commands and dispatches them.
+
+    Clients send "bench <client>-<sequence>", the latency of each command is
+    taken when its "bench" callback runs.
+    """
+
+    def __init__(self, server: ServerSocket, sent_at: dict, expected: int) -> None:
+        super().__init__(daemon=True)
+        self.server = server
+        self.sent_at = sent_at
+        self.expected = expected
+        self.processed = 0
+        self.latencies: list[float] = []
+        self.done = threading.Event()
+        server.register_callback("bench", self.on_bench, takes_argument=True)
+
+    def on_bench(self, tag: str) -> None:
+        self.latencies.append(time.perf_counter() - self.sent_at.pop(tag))
+
+    def run(self) -> None:
+        while self.processed < self.expected:
+            try:
+                command = self.server.commands.get(timeout=5)
+            except queue.Empty:
+                break
+            self.server.process_command(command)
+            self.processed += 1
+        self.done.set()
+
+
+async def run_client(
+    port: int, client: int, commands: int, batch: int, window: int, sent_at: dict
+) -> list[float]:
+    """Send commands from one controller and return its ack round trips."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    in_flight = asyncio.Semaphore(window)
+    frame_sent: dict = {}
+    round_trips: list[float] = []
+    frames = (commands + batch - 1) // batch
+
+    async def read_acks() -> None:
+        for _ in range(frames):
+            ack = json.loads(await reader.readline())
+            round_trips.append(time.perf_counter() - frame_sent.pop(ack["id"]))
+            in_flight.release()
+
+    acks = asyncio.create_task(read_acks())
+    sequence = 0
+    for frame_id in range(frames):
+        await in_flight.acquire()
+        tags = []
+        for _ in range(min(batch, commands - sequence)):
+            tags.append(f"{client}-{sequence}")
+            sequence += 1
+        now = time.perf_counter()
+        for tag in tags:
+            sent_at[tag] = now
+        frame_sent[frame_id] = now
+        writer.write(
+            encode_frame({"id": frame_id, "commands": [f"bench {tag}" for tag in tags]})
+        )
+        await writer.drain()
+
+    await acks
+    writer.close()
+    await writer.wait_closed()
+    return round_trips
+
+
+async def run_clients(port: int, args: argparse.Namespace, sent_at: dict) -> list[float]:
+    """Run every synthetic controller concurrently."""
+    results = await asyncio.gather(
+        *(
+            run_client(port, client, args.commands, args.batch, args.window, sent_at)
+            for client in range(args.clients)
+        )
+    )
+    return [round_trip for result in results for round_trip in result]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["asyncio", "thread"], default="asyncio")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--commands", type=int, default=1000, help="per client")
+    parser.add_argument("--batch", type=int, default=1, help="commands per frame")
+    parser.add_argument("--window", type=int, default=16, help="frames in flight")
+    parser.add_argument("--output", default="bench_results/server_benchmark.json")
+    parser.add_argument(
+        "--verbose", action="store_true", help="keep the server's per-message logs"
+    )
+    args = parser.parse_args()
+
+    sent_at: dict = {}
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+        # The server's database goes to a throwaway file, not the kiosk's
+        workdir = tempfile.mkdtemp(prefix="server_benchmark_")
+        stack.callback(shutil.rmtree, workdir, ignore_errors=True)
+        data.data_base.DB_PATH = os.path.join(workdir, "shared_data.db")
+        if not args.verbose:
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+
+        server = ServerSocket(host="127.0.0.1", port=0, mode=args.mode)
+        if not server.ready.wait(timeout=5):
+            raise SystemExit("The server did not start")
+
+        dispatcher = Dispatcher(server, sent_at, args.clients * args.commands)
+        dispatcher.start()
+        start = time.perf_counter()
+        round_trips = asyncio.run(run_clients(server.port, args, sent_at))
+        dispatcher.done.wait(timeout=30)
+        elapsed = time.perf_counter() - start
+        server.stop()
+
+    sent = args.clients * args.commands
+    if len(dispatcher.latencies) != sent:
+        raise SystemExit(
+            f"Only {len(dispatcher.latencies)} of {sent} commands reached their callback"
+        )
+
+    report = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": vars(args),
+        "elapsed_s": elapsed,
+        "dispatched": len(dispatcher.latencies),
+        "throughput_cmd_s": len(dispatcher.latencies) / elapsed,
+        "dispatch_latency": summarize(dispatcher.latencies),
+        "ack_round_trip": summarize(round_trips),
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    latency = report["dispatch_latency"]
+    print(
+        f"{args.mode}: {report['dispatched']} commands in {elapsed:.2f}s "
+        f"({report['throughput_cmd_s']:.0f} cmd/s), dispatch p50 "
+        f"{latency['p50_us']:.0f}us p99 {latency['p99_us']:.0f}us"
+    )
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
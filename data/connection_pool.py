@@ -0,0 +1,91 @@
+import sqlite3
+import threading
+
+from assets.config import DB_PATH, DB_BUSY_TIMEOUT_MS, DB_CACHED_STATEMENTS
+
+
+class ConnectionPool:
+    """Class to hand out one long-lived SQLite connection per thread."""
+
+    def __init__(self, path: str = DB_PATH) -> None:
+        """Initialize an empty pool for a database file.
+
+        Args:
+            path (str): Path of the SQLite database file.
+        """
+        self.path = path
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections: dict[threading.Thread, sqlite3.Connection] = {}
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection configured for concurrent readers and writers.
+
+        Returns:
+            Connection: A new SQLite connection in WAL mode.
+        """
+        conn = sqlite3.connect(
+            self.path,
+            timeout=DB_BUSY_TIMEOUT_MS / 1000,
+            cached_statements=DB_CACHED_STATEMENTS,
+            check_same_thread=False,
+        )
+        # WAL lets the render thread read while the socket thread writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+        return conn
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get the connection owned by the calling thread, opening it once.
+
+        Returns:
+            Connection: The connection of the current thread.
+        """
+        conn = getattr(self.local, "connection", None)
+        if conn is None:
+            conn = self.connect()
+            self.local.connection = conn
+            with self.lock:
+                self.prune()
+                self.connections[threading.current_thread()] = conn
+        return conn
+
+    def prune(self) -> None:
+        """Close the connections of threads that have finished."""
+        for thread in [t for t in self.connections if not t.is_alive()]:
+            self.connections.pop(thread).close()
+
+    def close_all(self) -> None:
+        """Close every connection in the pool."""
+        with self.lock:
+            for conn in self.connections.values():
+                conn.close()
+            self.connections.clear()
+        self.local = threading.local()
+
+
+pools: dict[str, ConnectionPool] = {}
+pools_lock = threading.Lock()
+
+
+def get_pool(path: str = DB_PATH) -> ConnectionPool:
+    """Get the process-wide pool for a database file.
+
+    Args:
+        path (str): Path of the SQLite database file.
+
+    Returns:
+        ConnectionPool: The pool shared by every DataBase of that file.
+    """
+    with pools_lock:
+        if path not in pools:
+            pools[path] = ConnectionPool(path)
+        return pools[path]
+
+
+def close_pools() -> None:
+    """Close the connections of every pool, once the threads using them stopped."""
+    with pools_lock:
+        for pool in pools.values():
+            pool.close_all()
@@ -0,0 +1,147 @@
+import sqlite3
+import threading
+
+from dotenv import dotenv_values
+
+from assets.config import DB_PATH, COUNTER_SYNCHRONOUS
+from data.connection_pool import get_pool
+
+# Counter of the slot machine spins, a win starts it over at 1
+SPIN_COUNTER: str = "spin"
+
+# The spin counter was kept as COUNTER in this file before the store existed
+LEGACY_ENV_PATH: str = "assets/.env"
+
+
+class CounterStore:
+    """Class to keep named counters in SQLite with atomic updates.
+
+    Every change is a single statement in its own transaction, so a crash
+    leaves either the old or the new value, never a half-written file. The
+    store keeps its own connection, committed with COUNTER_SYNCHRONOUS, so a
+    count that was returned is also on disk.
+    """
+
+    def __init__(self) -> None:
+        """Open the connection and create the counters table if needed."""
+        self.conn = get_pool(DB_PATH).connect()
+        self.conn.execute(f"PRAGMA synchronous={COUNTER_SYNCHRONOUS}")
+        self.lock = threading.Lock()
+        self.init_db()
+
+    def init_db(self) -> None:
+        """Create the counters table if it doesn't exist."""
+        with self.lock, self.conn:
+            self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS counters
+                        (name TEXT PRIMARY KEY,
+                        value INTEGER NOT NULL)
+                    """)
+
+    def seed(self, name: str, value: int) -> None:
+        """Create a counter with a starting value, unless it already exists.
+
+        Args:
+            name (str): The counter name.
+            value (int): The starting value.
+        """
+        try:
+            with self.lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO counters (name, value) VALUES (?, ?)",
+                    (name, value),
+                )
+        except sqlite3.Error as e:
+            print("Error seeding counter:", e)
+
+    def get(self, name: str) -> int:
+        """Get the value of a counter.
+
+        Args:
+            name (str): The counter name.
+
+        Returns:
+            int: The value, 0 if the counter does not exist.
+        """
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT value FROM counters WHERE name = ?", (name,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print("Error reading counter:", e)
+            return 0
+        return row[0] if row else 0
+
+    def increment(self, name: str, amount: int = 1) -> int:
+        """Add to a counter and return the new value in one statement.
+
+        Args:
+            name (str): The counter name, created at 0 if it does not exist.
+            amount (int): The amount to add.
+
+        Returns:
+            int: The value after the increment, 0 if it could not be written.
+        """
+        try:
+            with self.lock, self.conn:
+                return self.conn.execute(
+                    """INSERT INTO counters (name, value) VALUES (?, ?)
+                        ON CONFLICT (name) DO UPDATE SET value = value + excluded.value
+                        RETURNING value""",
+                    (name, amount),
+                ).fetchone()[0]
+        except sqlite3.Error as e:
+            print("Error incrementing counter:", e)
+            return 0
+
+    def set(self, name: str, value: int) -> None:
+        """Set a counter to a value.
+
+        Args:
+            name (str): The counter name.
+            value (int): The new value.
+        """
+        try:
+            with self.lock, self.conn:
+                self.conn.execute(
+                    """INSERT INTO counters (name, value) VALUES (?, ?)
+                        ON CONFLICT (name) DO UPDATE SET value = excluded.value""",
+                    (name, value),
+                )
+        except sqlite3.Error as e:
+            print("Error setting counter:", e)
+
+    def close(self) -> None:
+        """Close the connection of the store."""
+        with self.lock:
+            self.conn.close()
+
+
+def legacy_spin_counter() -> int:
+    """Read the spin counter left in the .env file, 0 if there is none."""
+    try:
+        return int(dotenv_values(LEGACY_ENV_PATH).get("COUNTER") or 0)
+    except (OSError, ValueError) as e:
+        print(f"Error reading the legacy counter: {e}")
+        return 0
+
+
+counters = None
+counters_lock = threading.Lock()
+
+
+def get_counter_store() -> CounterStore:
+    """Get the process-wide counter store, opening it on first use.
+
+    The spin counter is migrated from the .env file the first time.
+
+    Returns:
+        CounterStore: The shared counter store.
+    """
+    global counters
+    with counters_lock:
+        if counters is None:
+            counters = CounterStore()
+            counters.seed(SPIN_COUNTER, legacy_spin_counter())
+        return counters
@@ -1,30 +1,75 @@
 import sqlite3
+from contextlib import contextmanager
 from assets.config import DB_PATH
+from data.connection_pool import get_pool
+
+TABLES = ("state", "game_state")
+
+
+def check_table(table: str) -> None:
+    """Raise ValueError if the table is not one of the key-value tables."""
+    if table not in TABLES:
+        raise ValueError(f"Unknown table: {table}")
+
+
+class Transaction:
+    """Class to read and write keys of both tables inside one transaction."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def get(self, table: str, key: str):
+        """Retrieve the value of a key.
+
+        Args:
+            table (str): The table of the key, "state" or "game_state".
+            key (str): The key to read.
+
+        Returns:
+            str: The value associated with the key, or None if it does not exist.
+        """
+        check_table(table)
+        value = self.conn.execute(
+            f"SELECT value FROM {table} WHERE key = ?", (key,)
+        ).fetchone()
+        return value[0] if value else None
+
+    def set(self, table: str, key: str, value: str) -> None:
+        """Set the value of a key.
+
+        Args:
+            table (str): The table of the key, "state" or "game_state".
+            key (str): The key to write.
+            value (str): The value to be associated with the key.
+        """
+        check_table(table)
+        self.conn.execute(
+            f"REPLACE INTO {table} (key, value) VALUES (?, ?)", (key, value)
+        )
+
 
 class DataBase:
     """Class to handle database operations."""
 
     def __init__(self) -> None:
-        self.conn = None
+        self.pool = get_pool(DB_PATH)
         self.init_db()  # Initialize the database when the class is instantiated
 
     def init_db(self) -> None:
         """Initialize the database and create the necessary tables if they don't exist."""
-        self.conn = sqlite3.connect(DB_PATH)
-        cursor = self.conn.cursor()
-        cursor.execute(""" 
+        conn = self.pool.get_connection()
+        with conn:
+            conn.execute(""" 
                     CREATE TABLE IF NOT EXISTS state 
                         (key TEXT PRIMARY KEY, 
                         value TEXT)
                     """)
 
-        cursor.execute("""
+            conn.execute("""
                     CREATE TABLE IF NOT EXISTS game_state 
                         (key TEXT PRIMARY KEY, 
                         value TEXT)
                     """)
-        self.conn.commit()
-        self.conn.close()
 
     def set_value_state(self, key: str, value: str) -> None:
         """Set the value of a state key in the database.
@@ -34,17 +79,13 @@ class DataBase:
             value (str): The value to be associated with the key.
         """
         try:
-            self.conn = sqlite3.connect(DB_PATH)
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "REPLACE INTO state (key, value) VALUES (?, ?)", (key, value)
-            )
-            self.conn.commit()
+            conn = self.pool.get_connection()
+            with conn:
+                conn.execute(
+                    "REPLACE INTO state (key, value) VALUES (?, ?)", (key, value)
+                )
         except sqlite3.Error as e:
             print("Error setting value state:", e)
-        finally:
-            if self.conn:
-                self.conn.close()
 
     def get_value_state(self, key: str):
         """Retrieve the value associated with a state key from the database.
@@ -56,17 +97,14 @@ class DataBase:
             str: The value associated with the key, or None if the key does not exist.
         """
         try:
-            self.conn = sqlite3.connect(DB_PATH)
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT value FROM state WHERE key = ?", (key,))
-            value = cursor.fetchone()
+            conn = self.pool.get_connection()
+            value = conn.execute(
+                "SELECT value FROM state WHERE key = ?", (key,)
+            ).fetchone()
 
             return value[0] if value else None
         except sqlite3.Error as e:
             print("Error retrieving VALUE STATE from the data base:", e)
-        finally:
-            if self.conn:
-                self.conn.close()
 
     def set_value_game_state(self, key: str, value: str) -> None:
         """Set the value of a game state key in the database.
@@ -76,17 +114,13 @@ class DataBase:
             value (str): The value to be associated with the key.
         """
         try:
-            self.conn = sqlite3.connect(DB_PATH)
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "REPLACE INTO game_state (key, value) VALUES (?, ?)", (key, value)
-            )
-            self.conn.commit()
+            conn = self.pool.get_connection()
+            with conn:
+                conn.execute(
+                    "REPLACE INTO game_state (key, value) VALUES (?, ?)", (key, value)
+                )
         except sqlite3.Error as e:
             print("Error setting game state:", e)
-        finally:
-            if self.conn:
-                self.conn.close()
 
     def get_value_game_state(self, key: str):
         """Retrieve the value associated with a game state key from the database.
@@ -98,14 +132,95 @@ class DataBase:
             str: The value associated with the key, or None if the key does not exist.
         """
         try:
-            self.conn = sqlite3.connect(DB_PATH)
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT value FROM game_state WHERE key = ?", (key,))
-            value = cursor.fetchone()
+            conn = self.pool.get_connection()
+            value = conn.execute(
+                "SELECT value FROM game_state WHERE key = ?", (key,)
+            ).fetchone()
 
             return value[0] if value else None
         except sqlite3.Error as e:
             print("Error get value game state:", e)
-        finally:
-            if self.conn:
-                self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """Open a write transaction covering the state and game_state tables.
+
+        Everything set inside the block is committed once on exit, so readers
+        observe all the changes at the same time. It is rolled back if the
+        block raises.
+
+        Yields:
+            Transaction: The object used to read and write keys.
+        """
+        conn = self.pool.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield Transaction(conn)
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def get_many(self, keys: list[tuple[str, str]]) -> dict:
+        """Retrieve several keys from both tables in one read transaction.
+
+        Args:
+            keys (list[tuple[str, str]]): The (table, key) pairs to read.
+
+        Returns:
+            dict: The value of each (table, key) pair, or None if it does not exist.
+        """
+        values = {}
+        try:
+            conn = self.pool.get_connection()
+            conn.execute("BEGIN")
+            try:
+                transaction = Transaction(conn)
+                for table, key in keys:
+                    values[(table, key)] = transaction.get(table, key)
+            finally:
+                conn.rollback()
+        except sqlite3.Error as e:
+            print("Error retrieving many values from the data base:", e)
+        return values
+
+    def set_many(self, values: dict) -> None:
+        """Set several keys of both tables with a single commit.
+
+        Args:
+            values (dict): The value of each (table, key) pair.
+        """
+        try:
+            with self.transaction() as transaction:
+                for (table, key), value in values.items():
+                    transaction.set(table, key, value)
+        except sqlite3.Error as e:
+            print("Error setting many values:", e)
+
+    def get_table(self, table: str) -> dict:
+        """Retrieve every key and value of a table.
+
+        Args:
+            table (str): The table to read, "state" or "game_state".
+
+        Returns:
+            dict: The values of the table by key.
+        """
+        check_table(table)
+        try:
+            conn = self.pool.get_connection()
+            return dict(conn.execute(f"SELECT key, value FROM {table}").fetchall())
+        except sqlite3.Error as e:
+            print("Error retrieving table from the data base:", e)
+            return {}
+
+    def get_data_version(self) -> int:
+        """Get the SQLite data version of the current thread's connection.
+
+        The value changes whenever another connection commits to the file.
+
+        Returns:
+            int: The data version.
+        """
+        conn = self.pool.get_connection()
+        return conn.execute("PRAGMA data_version").fetchone()[0]
@@ -47,9 +47,11 @@ class InternalData:
         return int(os.getenv("PORT", "9999"))
     
     def get_counter(self) -> int:
-        """Get counter value from environment variables.
+        """Get the spin counter, now kept in the counter store.
 
         Returns:
             int: The counter value.
         """
-        return int(os.getenv("COUNTER", "0"))
+        from data.counter_store import SPIN_COUNTER, get_counter_store
+
+        return get_counter_store().get(SPIN_COUNTER)
@@ -0,0 +1,190 @@
+import queue
+import sqlite3
+import threading
+import time
+
+from assets.config import DB_PATH, LEDGER_BATCH_SIZE, LEDGER_COMMIT_INTERVAL_MS
+from data.connection_pool import get_pool
+
+BUCKETS = {
+    "hour": "%Y-%m-%d %H:00",
+    "day": "%Y-%m-%d",
+}
+
+
+class SpinLedger:
+    """Class to append every spin to an indexed ledger table.
+
+    Rows are queued by the game and written by a background thread that
+    commits them in groups, so the animation never waits on disk.
+    """
+
+    def __init__(self) -> None:
+        """Create the ledger table if needed and start the writer thread."""
+        self.pool = get_pool(DB_PATH)
+        self.rows = queue.Queue()
+        self.running = True
+        self.init_db()
+
+        self.worker = threading.Thread(target=self.worker_loop, daemon=True)
+        self.worker.start()
+
+    def init_db(self) -> None:
+        """Create the ledger table and its indexes if they don't exist."""
+        conn = self.pool.get_connection()
+        with conn:
+            conn.execute("""
+                    CREATE TABLE IF NOT EXISTS spin_ledger
+                        (id INTEGER PRIMARY KEY,
+                        timestamp REAL NOT NULL,
+                        counter INTEGER NOT NULL,
+                        reel_1 INTEGER NOT NULL,
+                        reel_2 INTEGER NOT NULL,
+                        reel_3 INTEGER NOT NULL,
+                        outcome TEXT NOT NULL,
+                        duration_ms INTEGER NOT NULL)
+                    """)
+            # Covers time range scans grouped by outcome without touching rows
+            conn.execute("""
+                    CREATE INDEX IF NOT EXISTS spin_ledger_timestamp_outcome
+                        ON spin_ledger (timestamp, outcome)
+                    """)
+            # Counts a single outcome over a time range
+            conn.execute("""
+                    CREATE INDEX IF NOT EXISTS spin_ledger_outcome_timestamp
+                        ON spin_ledger (outcome, timestamp)
+                    """)
+
+    def record(
+        self,
+        timestamp: float,
+        counter: int,
+        reels: list[int],
+        outcome: str,
+        duration_ms: int,
+    ) -> None:
+        """Queue a spin to be written to the ledger.
+
+        Args:
+            timestamp (float): Unix time when the spin started.
+            counter (int): The spin counter of this spin.
+            reels (list[int]): Final symbol index of the three reels.
+            outcome (str): "GANADOR" or "PERDEDOR".
+            duration_ms (int): How long the spin took, in milliseconds.
+        """
+        self.rows.put((timestamp, counter, *reels, outcome, duration_ms))
+
+    def worker_loop(self) -> None:
+        """Write queued rows in groups, one transaction per group."""
+        while self.running:
+            try:
+                batch = [self.rows.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+
+            # Wait a little for more rows so they share the same commit
+            deadline = time.monotonic() + LEDGER_COMMIT_INTERVAL_MS / 1000
+            while len(batch) < LEDGER_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.rows.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self.write(batch)
+            for _ in batch:
+                self.rows.task_done()
+
+    def write(self, batch: list[tuple]) -> None:
+        """Insert a group of rows with a single commit."""
+        try:
+            conn = self.pool.get_connection()
+            with conn:
+                conn.executemany(
+                    """INSERT INTO spin_ledger
+                        (timestamp, counter, reel_1, reel_2, reel_3, outcome, duration_ms)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    batch,
+                )
+        except sqlite3.Error as e:
+            print("Error writing spin ledger:", e)
+
+    def summary(self, start: float, end: float, bucket: str = "hour") -> list[tuple]:
+        """Count wins and losses per hour or per day, in local time.
+
+        Args:
+            start (float): Unix time of the first spin to include.
+            end (float): Unix time after the last spin to include.
+            bucket (str): "hour" or "day".
+
+        Returns:
+            list[tuple]: Rows of (bucket label, wins, losses), oldest first.
+        """
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket: {bucket}")
+        try:
+            conn = self.pool.get_connection()
+            return conn.execute(
+                """SELECT strftime(?, timestamp, 'unixepoch', 'localtime') AS bucket,
+                        SUM(outcome = 'GANADOR'),
+                        SUM(outcome = 'PERDEDOR')
+                    FROM spin_ledger
+                    WHERE timestamp >= ? AND timestamp < ?
+                    GROUP BY bucket
+                    ORDER BY bucket""",
+                (BUCKETS[bucket], start, end),
+            ).fetchall()
+        except sqlite3.Error as e:
+            print("Error reading spin ledger:", e)
+            return []
+
+    def count(self, outcome: str, start: float, end: float) -> int:
+        """Count the spins with an outcome in a time range.
+
+        Args:
+            outcome (str): "GANADOR" or "PERDEDOR".
+            start (float): Unix time of the first spin to include.
+            end (float): Unix time after the last spin to include.
+
+        Returns:
+            int: The number of matching spins.
+        """
+        try:
+            conn = self.pool.get_connection()
+            return conn.execute(
+                """SELECT COUNT(*) FROM spin_ledger
+                    WHERE outcome = ? AND timestamp >= ? AND timestamp < ?""",
+                (outcome, start, end),
+            ).fetchone()[0]
+        except sqlite3.Error as e:
+            print("Error reading spin ledger:", e)
+            return 0
+
+    def flush(self) -> None:
+        """Block until every queued row has been written."""
+        self.rows.join()
+
+    def stop(self) -> None:
+        """Write pending rows and stop the writer thread."""
+        self.flush()
+        self.running = False
+        self.worker.join()
+
+
+ledger = None
+ledger_lock = threading.Lock()
+
+
+def get_spin_ledger() -> SpinLedger:
+    """Get the process-wide spin ledger, starting it on first use.
+
+    Returns:
+        SpinLedger: The shared spin ledger.
+    """
+    global ledger
+    with ledger_lock:
+        if ledger is None:
+            ledger = SpinLedger()
+        return ledger
@@ -0,0 +1,202 @@
+import queue
+import threading
+
+from assets.config import STATE_POLL_INTERVAL_MS
+from data.data_base import DataBase, TABLES, check_table
+from logic.events import STATE_CHANGED, post_event
+
+
+class StateStore:
+    """Class to serve state reads from memory and persist writes in the background.
+
+    It mirrors the getters and setters of DataBase, so it can be used in its
+    place. Changes made by other processes to the same SQLite file are picked
+    up by a background thread.
+    """
+
+    def __init__(self) -> None:
+        """Load the current state and start the background writer."""
+        self.shared_data = DataBase()
+        self.lock = threading.Lock()
+        self.values: dict[tuple[str, str], str] = {}
+        self.pending: dict[tuple[str, str], int] = {}
+        self.listeners = []
+        self.writes = queue.Queue()
+        self.running = True
+
+        for table in TABLES:
+            for key, value in self.shared_data.get_table(table).items():
+                self.values[(table, key)] = value
+
+        self.worker = threading.Thread(target=self.worker_loop, daemon=True)
+        self.worker.start()
+
+    def subscribe(self, callback) -> None:
+        """Register a callback called as callback(table, key, value) on changes.
+
+        Callbacks may run on the background thread.
+
+        Args:
+            callback (function): The callback function to register.
+        """
+        self.listeners.append(callback)
+
+    def notify(self, table: str, key: str, value: str) -> None:
+        """Tell listeners and the pygame event loop that a key changed."""
+        for callback in self.listeners:
+            callback(table, key, value)
+        post_event(STATE_CHANGED, table=table, key=key, value=value)
+
+    def get(self, table: str, key: str):
+        """Get a value from memory.
+
+        Args:
+            table (str): The table of the key, "state" or "game_state".
+            key (str): The key to read.
+
+        Returns:
+            str: The value associated with the key, or None if it does not exist.
+        """
+        return self.values.get((table, key))
+
+    def set(self, table: str, key: str, value: str) -> None:
+        """Set a value in memory and queue it to be written to the database.
+
+        Args:
+            table (str): The table of the key, "state" or "game_state".
+            key (str): The key to write.
+            value (str): The value to be associated with the key.
+        """
+        self.set_many({(table, key): value})
+
+    def get_many(self, keys: list[tuple[str, str]]) -> dict:
+        """Get several values from memory.
+
+        Args:
+            keys (list[tuple[str, str]]): The (table, key) pairs to read.
+
+        Returns:
+            dict: The value of each (table, key) pair, or None if it does not exist.
+        """
+        with self.lock:
+            return {key: self.values.get(key) for key in keys}
+
+    def set_many(self, values: dict) -> None:
+        """Set several values at once and persist them with a single commit.
+
+        Readers see every value change together, both in memory and in the
+        database.
+
+        Args:
+            values (dict): The value of each (table, key) pair.
+        """
+        for table, _ in values:
+            check_table(table)
+        with self.lock:
+            changes = [
+                (table, key, value)
+                for (table, key), value in values.items()
+                if self.values.get((table, key)) != value
+            ]
+            for key, value in values.items():
+                self.values[key] = value
+                self.pending[key] = self.pending.get(key, 0) + 1
+        self.writes.put(dict(values))
+        for change in changes:
+            self.notify(*change)
+
+    def get_value_state(self, key: str):
+        """Get the value of a state key."""
+        return self.get("state", key)
+
+    def set_value_state(self, key: str, value: str) -> None:
+        """Set the value of a state key."""
+        self.set("state", key, value)
+
+    def get_value_game_state(self, key: str):
+        """Get the value of a game state key."""
+        return self.get("game_state", key)
+
+    def set_value_game_state(self, key: str, value: str) -> None:
+        """Set the value of a game state key."""
+        self.set("game_state", key, value)
+
+    def worker_loop(self) -> None:
+        """Persist queued writes and reload values changed by other writers."""
+        self.data_version = self.shared_data.get_data_version()
+        while self.running:
+            try:
+                batches = [self.writes.get(timeout=STATE_POLL_INTERVAL_MS / 1000)]
+            except queue.Empty:
+                batches = []
+            while batches:
+                try:
+                    batches.append(self.writes.get_nowait())
+                except queue.Empty:
+                    break
+            if batches:
+                self.persist(batches)
+            self.refresh()
+
+    def persist(self, batches: list[dict]) -> None:
+        """Write every queued batch to the database in one transaction."""
+        values = {}
+        for batch in batches:
+            values.update(batch)
+        self.shared_data.set_many(values)
+        with self.lock:
+            for batch in batches:
+                for key in batch:
+                    self.pending[key] -= 1
+                    if not self.pending[key]:
+                        del self.pending[key]
+        for _ in batches:
+            self.writes.task_done()
+
+    def refresh(self) -> None:
+        """Reload the tables if another connection committed since last check."""
+        data_version = self.shared_data.get_data_version()
+        if data_version == self.data_version:
+            return
+        self.data_version = data_version
+
+        changes = []
+        for table in TABLES:
+            rows = self.shared_data.get_table(table)
+            with self.lock:
+                for key, value in rows.items():
+                    # Keys with unsaved local writes keep their newer value
+                    if (table, key) in self.pending:
+                        continue
+                    if self.values.get((table, key)) != value:
+                        self.values[(table, key)] = value
+                        changes.append((table, key, value))
+        for change in changes:
+            self.notify(*change)
+
+    def flush(self) -> None:
+        """Block until every queued write has been persisted."""
+        self.writes.join()
+
+    def stop(self) -> None:
+        """Persist pending writes and stop the background thread."""
+        self.flush()
+        self.running = False
+        self.worker.join()
+
+
+store = None
+store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """Get the process-wide state store, starting it on first use.
+
+    Returns:
+        StateStore: The shared state store.
+    """
+    global store
+    with store_lock:
+        if store is None:
+            store = StateStore()
+        return store
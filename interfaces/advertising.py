@@ -1,11 +1,14 @@
 import pygame
-import moviepy.editor as mp
-import os
-
+from logic.asset_manager import asset_manager
+from logic.frame_timer import frame_timer
+from logic.frame_upload import FrameUploader
+from logic.gradient_cache import gradient_cache
+from logic.playback_clock import PlaybackClock
+from logic.playlist import get_playlist
+from logic.video_decoder import VideoDecoder
 from assets.config import(
     ADVERTISING_IMAGE_PATH,
-    ADVERTISING_VIDEO_PATH,
-    ADVERTISING_AUDIO_PATH,
+    ADVERTISING_MAX_FPS,
     AQUAMARINE,
     ORANGE_NEON,
 )
@@ -14,86 +17,61 @@ class Advertising:
     """Class to handle video playback with audio in a Pygame window."""
 
     def __init__(self) -> None:
-        """Initialize Pygame, set up the display, and load video files."""
-        pygame.init()
+        """Load the assets and the playlist for the display surface opened by Init."""
         pygame.mixer.init()
 
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        self.screen = pygame.display.get_surface()
         self.screen_width, self.screen_height = self.screen.get_size()
-        self.gradient_surface = pygame.Surface((self.screen_width, self.screen_height))
-        self.icon = pygame.image.load(f"{ADVERTISING_IMAGE_PATH}icon_plant.png")
-        pygame.mouse.set_visible(False)
-        pygame.display.set_caption("Advertising Interface")
-        pygame.display.set_icon(self.icon)
+        self.max_fps: int = ADVERTISING_MAX_FPS
 
         self.padding = 100
         self.side_padding = self.padding * 2
 
-        self.video_files = [
-            os.path.join(ADVERTISING_VIDEO_PATH, f)
-            for f in os.listdir(ADVERTISING_VIDEO_PATH)
-            if f.endswith(".mp4")
-        ]
+        # Clips are played from the cache baked by logic.media_ingest, new
+        # videos are baked in the background by the playlist watcher
+        self.playlist = get_playlist()
+        if not self.playlist.items:
+            print("No baked videos yet, waiting for the playlist watcher")
 
         self.running = True
-        self.clock = pygame.time.Clock()
-        self.video_index = 0
-        self.audio_started = False  # New flag to control the start of the audio
-        self.should_exit = False  # New flag to control the exit of the video loop
+        self.playback_clock = PlaybackClock()
 
-        self.decoration_images = {
-            "top_left": pygame.image.load(f"{ADVERTISING_IMAGE_PATH}left_lamp.png"),
-            "bottom_left": pygame.image.load(
-                f"{ADVERTISING_IMAGE_PATH}right_plant.png"
-            ),
-            "bottom_right": pygame.image.load(
-                f"{ADVERTISING_IMAGE_PATH}right_plant.png"
-            ),
-            "top_right": pygame.image.load(f"{ADVERTISING_IMAGE_PATH}left_lamp.png"),
-        }
+        # Images are acquired from the asset manager on resume and released
+        # on suspend
+        self.icon = None
+        self.decoration_images = {}
 
         self.draw_gradient_surface()
-        self.resize_decoration_images()
-        self.current_clip = None
-        self.frame_iterator = None
-        self.current_audio_path = None
-        self.audio_index = 0
-        self.is_stopping = False
+        self.decoder = VideoDecoder(self.playlist)
+        self.frame_uploader = FrameUploader()
         self.last_frame = None  # Save the last frame to avoid black screen
+        self.shown_frame = None  # DecodedFrame currently on screen
+        self.shown_until = 0.0  # Clock position the shown frame is due to end
+        self.pending_frame = None  # Dequeued frame that is not due yet
 
     def draw_gradient_surface(self) -> None:
-        """Draw a gradient background for the display surface."""
-        for i in range(self.screen_height):
-            color = (
-                AQUAMARINE[0]
-                + (ORANGE_NEON[0] - AQUAMARINE[0]) * i / self.screen_height,
-                AQUAMARINE[1]
-                + (ORANGE_NEON[1] - AQUAMARINE[1]) * i / self.screen_height,
-                AQUAMARINE[2]
-                + (ORANGE_NEON[2] - AQUAMARINE[2]) * i / self.screen_height,
-            )
-            pygame.draw.line(
-                self.gradient_surface, color, (0, i), (self.screen_width, i)
-            )
-
-    def resize_decoration_images(self) -> None:
-        """Resize decoration images for proper display on the screen."""
-        self.decoration_images["top_left"] = pygame.transform.scale(
-            self.decoration_images["top_left"],
-            (self.screen_width // 11, self.screen_height // 7),
+        """Select the gradient background for the display surface."""
+        self.gradient_surface = gradient_cache.get(
+            AQUAMARINE, ORANGE_NEON, (self.screen_width, self.screen_height)
         )
-        self.decoration_images["bottom_left"] = pygame.transform.scale(
-            self.decoration_images["bottom_left"],
-            (self.screen_width // 6, self.screen_height // 4),
-        )
-        self.decoration_images["bottom_right"] = pygame.transform.scale(
-            self.decoration_images["bottom_right"],
-            (self.screen_width // 6, self.screen_height // 4),
-        )
-        self.decoration_images["top_right"] = pygame.transform.scale(
-            self.decoration_images["top_right"],
-            (self.screen_width // 11, self.screen_height // 7),
+
+    def load_images(self) -> None:
+        """Acquire the icon and the decoration images scaled for the screen."""
+        lamp = f"{ADVERTISING_IMAGE_PATH}left_lamp.png"
+        plant = f"{ADVERTISING_IMAGE_PATH}right_plant.png"
+        lamp_size = (self.screen_width // 11, self.screen_height // 7)
+        plant_size = (self.screen_width // 6, self.screen_height // 4)
+
+        self.icon = asset_manager.image(
+            "advertising", f"{ADVERTISING_IMAGE_PATH}icon_plant.png"
         )
+        # Both lamps and both plants share one surface
+        self.decoration_images = {
+            "top_left": asset_manager.image("advertising", lamp, lamp_size),
+            "bottom_left": asset_manager.image("advertising", plant, plant_size),
+            "bottom_right": asset_manager.image("advertising", plant, plant_size),
+            "top_right": asset_manager.image("advertising", lamp, lamp_size),
+        }
     
     def draw_decorations(self, screen) -> None:
         """Draw decorations on the screen."""
@@ -120,154 +98,122 @@ class Advertising:
             ),
         )
         
-    def load_and_resize_video(self, video_path: str) -> mp.VideoFileClip:
-        """
-        Load a video file and resize it to a target resolution.
-
-        Args:
-            video_path (str): The path to the video file.
-
-        Returns:
-            VideoFileClip: The resized video clip.
-        """
-        try:
-            if self.current_clip:
-                self.cleanup_current_video()
-            
-            clip = mp.VideoFileClip(video_path)
-            target_resolution = (576, 720)
-            clip = clip.resize(newsize=target_resolution)
-            return clip
-        except Exception as e:
-            print(f"Error loading video: {e}")
-            return None
-
     def clip_to_surface(self, frame) -> pygame.Surface:
         """
-        Convert a video frame to a Pygame surface.
+        Copy a video frame into the persistent surface of its resolution.
 
         Args:
             frame (ndarray): The video frame as a NumPy array.
 
         Returns:
-            Surface: The Pygame surface created from the video frame.
-        """
-        return pygame.image.frombuffer(frame.tobytes(), frame.shape[1::-1], "RGB")
-
-    def get_temp_audio_path(self) -> str:
-        """
-        Generate a unique path for each temporary audio file.
-
-        Returns:
-            str: The path to the temporary audio file.
+            Surface: The Pygame surface holding the video frame.
         """
-        self.audio_index += 1
-        return f"{ADVERTISING_AUDIO_PATH}temp_audio_{self.audio_index}.mp3"
+        return self.frame_uploader.upload(frame)
 
-    def load_audio_for_clip(self) -> bool:
+    def is_animating(self) -> bool:
         """
-        Load and prepare the audio for the current clip.
+        Check if the screen changes without any event, while a clip plays.
 
         Returns:
-            bool: True if the audio was loaded successfully, False otherwise.
+            bool: False until the playlist has a clip to play.
         """
-        try:
-            # Stop and clear previous audio
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
-                pygame.mixer.music.unload()
-            
-            # Clear previous file if it exists
-            if self.current_audio_path and os.path.exists(self.current_audio_path):
-                try:
-                    pygame.mixer.music.unload()
-                    pygame.time.wait(100)  # Small pause to ensure it is released
-                    os.remove(self.current_audio_path)
-                except Exception as e:
-                    print(f"Error removing old audio: {e}")
-
-            # Generate new path for the audio
-            self.current_audio_path = self.get_temp_audio_path()
-
-            if self.current_clip and self.current_clip.audio:
-                self.current_clip.audio.write_audiofile(self.current_audio_path, fps=44100)
-                pygame.mixer.music.load(self.current_audio_path)
-                pygame.mixer.music.play()
-                self.audio_loaded = True
-                return True
-            return False
-
-        except Exception as e:
-            print(f"Error loading audio: {e}")
-            self.audio_loaded = False
-            return False
+        return self.running and (
+            self.shown_frame is not None or bool(self.playlist.items)
+        )
 
     def run(self, screen) -> None:
         """Render a single frame of the advertising video."""
-        if not self.running or not self.video_files:
+        if not self.running:
             return
 
         try:
-            # Load the current video if not loaded
-            if not hasattr(self, "current_clip") or self.current_clip is None:
-                video_path = self.video_files[self.video_index]
-                self.current_clip = self.load_and_resize_video(video_path)
-                if self.current_clip is None:
-                    return
-                self.frame_iterator = self.current_clip.iter_frames(fps=8.3, dtype="uint8")
-                self.start_audio(self.current_clip)
-
-            # Keep the last frame while loading the next video
+            self.decoder.start()
+
+            # Only dequeue here, opening and decoding happen on the decoder thread
+            with frame_timer.stage("advertising.select_frame"):
+                frame = self.select_frame()
+            if frame is not None:
+                with frame_timer.stage("advertising.upload"):
+                    self.last_frame = self.clip_to_surface(frame.image)
+
+            # Keep the last frame while the next one is decoded
             if self.last_frame is not None:
-                screen.blit(self.gradient_surface, (0, 0))
-                screen.blit(self.last_frame, ((self.screen_width - self.current_clip.size[0]) // 2, 0))
-                self.draw_decorations(screen)
-
-            try:
-                frame = next(self.frame_iterator)
-                surface = self.clip_to_surface(frame)
-                self.last_frame = surface  # Save the current frame
-                
-                screen.blit(self.gradient_surface, (0, 0))
-                screen.blit(surface, ((self.screen_width - self.current_clip.size[0]) // 2, 0))
-                self.draw_decorations(screen)
-                
-                # Synchronize FPS with the original video
-                self.clock.tick(10)
-                
-            except StopIteration:
-                # Keep the last frame while preparing the next video
-                if self.last_frame is not None:
+                with frame_timer.stage("advertising.draw"):
                     screen.blit(self.gradient_surface, (0, 0))
-                    screen.blit(self.last_frame, ((self.screen_width - self.current_clip.size[0]) // 2, 0))
+                    screen.blit(
+                        self.last_frame,
+                        ((self.screen_width - self.last_frame.get_width()) // 2, 0),
+                    )
                     self.draw_decorations(screen)
-                
-                self.cleanup_current_video()
-                self.video_index = (self.video_index + 1) % len(self.video_files)
-                self.current_clip = None
-                self.frame_iterator = None
-                return
 
         except Exception as e:
             print(f"Error during playback: {e}")
-            self.cleanup_current_video()
 
-    def start_audio(self, clip: mp.VideoFileClip) -> None:
+    def select_frame(self):
         """
-        Start the audio playback of the video.
+        Pick the frame due at the playback clock.
+
+        Frames whose time has passed are dropped so the picture catches up
+        with the audio, and the shown frame is kept (repeated) while the next
+        one is not due or not decoded yet.
+
+        Returns:
+            DecodedFrame: The frame to show, or None to keep the current one.
+        """
+        clock = self.playback_clock
+        position = clock.position()
+        selected = None
+        while True:
+            frame = self.pending_frame or self.decoder.get_frame()
+            self.pending_frame = None
+            if frame is None:
+                # The decoder fell behind, the shown frame stays one more slot
+                if selected is None and self.shown_frame is not None and (
+                    position >= self.shown_until
+                ):
+                    clock.repeated_frames += 1
+                    self.shown_until += self.shown_frame.duration
+                break
+
+            if frame.new_clip:
+                # The next clip starts once the last frame of this one is done
+                if selected is not None or (
+                    self.shown_frame is not None and position < self.shown_until
+                ):
+                    self.pending_frame = frame
+                    break
+                if self.shown_frame is not None:
+                    print(f"Playback sync: {clock.stats()}")
+                self.start_audio(frame.audio_path)
+                clock.start(audio=frame.audio_path is not None)
+                position = clock.position()
+            elif frame.timestamp > position:
+                self.pending_frame = frame
+                break
+            elif selected is not None:
+                clock.dropped_frames += 1
+            selected = frame
+
+        if selected is not None:
+            self.shown_frame = selected
+            self.shown_until = selected.timestamp + selected.duration
+            clock.record(selected.timestamp, position)
+        return selected
+
+    def start_audio(self, audio_path: str) -> None:
+        """
+        Start the audio playback of a clip.
 
         Args:
-            clip (VideoFileClip): The video clip whose audio will be played.
+            audio_path (str): The audio file extracted by the decoder, or None
+                if the clip is silent.
         """
-        self.current_audio_path = f"{ADVERTISING_AUDIO_PATH}temp_audio_{self.audio_index}.mp3"
         try:
-            if os.path.exists(self.current_audio_path):
-                os.remove(self.current_audio_path)
-            
-            clip.audio.write_audiofile(self.current_audio_path, fps=44100)
-            pygame.mixer.music.load(self.current_audio_path)
+            if audio_path is None:
+                pygame.mixer.music.stop()
+                return
+            pygame.mixer.music.load(audio_path)
             pygame.mixer.music.play()
-            self.audio_index += 1
         except Exception as e:
             print(f"Error processing audio: {e}")
 
@@ -276,38 +222,43 @@ class Advertising:
         try:
             if pygame.mixer.music.get_busy():
                 pygame.mixer.music.stop()
-                pygame.mixer.music.unload()
-            
-            if self.current_clip:
-                self.current_clip.close()
-                self.current_clip = None
-            
-            if self.current_audio_path and os.path.exists(self.current_audio_path):
-                try:
-                    os.remove(self.current_audio_path)
-                except:
-                    pass
-                
+            pygame.mixer.music.unload()
         except Exception as e:
             print(f"Error cleaning up resources: {e}")
 
+    def suspend(self) -> None:
+        """Pause playback while another interface is shown.
+
+        The audio and the playback clock are paused. The decoder keeps its
+        thread and buffered frames, it blocks once the buffer is full.
+        """
+        try:
+            pygame.mixer.music.pause()
+        except Exception as e:
+            print(f"Error pausing audio: {e}")
+        self.playback_clock.pause()
+        self.icon = None
+        self.decoration_images = {}
+        asset_manager.release("advertising")
+
+    def resume(self) -> None:
+        """Continue playback where it was suspended."""
+        self.load_images()
+        pygame.display.set_caption("Advertising Interface")
+        pygame.display.set_icon(self.icon)
+        pygame.mouse.set_visible(False)
+        self.playback_clock.resume()
+        try:
+            pygame.mixer.music.unpause()
+        except Exception as e:
+            print(f"Error resuming audio: {e}")
+
     def stop(self) -> None:
         """Stop video playback and clean up resources."""
-        self.is_stopping = True
         self.running = False
         self.cleanup_current_video()
-        
-        # Clean up all temporary audio files
-        for i in range(self.audio_index + 1):
-            temp_path = f"{ADVERTISING_AUDIO_PATH}temp_audio_{i}.mp3"
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-        
-        self.video_index = 0
-        self.audio_index = 0
-        pygame.time.wait(100)
-
-
+        self.decoder.stop()
+        self.last_frame = None
+        self.shown_frame = None
+        self.pending_frame = None
+        self.frame_uploader.clear()
@@ -6,10 +6,19 @@ from assets.config import (
     CHARTREUSE,
     ORANGE_NEON,
 )
-from data.data_base import DataBase
+from data.state_store import get_state_store
+from data.spin_ledger import get_spin_ledger
+from data.counter_store import get_counter_store
+from data.connection_pool import close_pools
 from data.internal_data import InternalData
 from server.server_socket import ServerSocket
 from logic.manage_interface import InterfaceManager
+from logic.playlist import get_playlist
+from logic.asset_manager import asset_manager
+from logic.gradient_cache import gradient_cache
+from logic.events import COMMAND_RECEIVED, CONNECTION_CHANGED
+from logic.frame_timer import frame_timer
+from logic.scheduler import FrameScheduler
 
 class Init:
     """Class to initialize the application and handle the initial interface."""
@@ -21,10 +30,11 @@ class Init:
         self.screen_width, self.screen_height = self.screen.get_size()
         
         self.internal_data = InternalData()
-        self.shared_data = DataBase()
+        self.shared_data = get_state_store()
         self.running = True
         self.first_command_received = False
-        self.connection_established = False
+        self.connection_established = None
+        self.scheduler = FrameScheduler()
 
         # Initialize the socket and interface manager with the existing screen
         self.socket_client = ServerSocket()
@@ -37,18 +47,16 @@ class Init:
         
         # Setup Pygame window
         self.setup_pygame_window()
-        
-        # Create gradient surface for the entire screen
-        self.gradient_surface = pygame.Surface((self.screen_width, self.screen_height))
 
         # Update connection state after initializing the socket
         self.update_connection_state()
 
     def update_connection_state(self) -> None:
         """Update the connection state from the socket."""
-        self.connection_established = self.socket_client.connection_established
-        if not self.connection_established:
+        connected = self.socket_client.connection_established
+        if connected != self.connection_established and not connected:
             print("Waiting for server connection...")
+        self.connection_established = connected
 
     def register_command_handlers(self) -> None:
         """Register command handlers for the server commands."""
@@ -56,18 +64,22 @@ class Init:
         self.socket_client.register_callback("publicidad", self.handle_publicidad)
         self.socket_client.register_callback("button", self.handle_button)
         self.socket_client.register_callback("salir", self.handle_salir)
+        self.socket_client.register_callback(
+            "playlist", get_playlist().handle_command, takes_argument=True
+        )
+        self.socket_client.register_callback(
+            "timing", frame_timer.handle_command, takes_argument=True
+        )
 
     def handle_sorteo(self) -> None:
         """Handle the 'sorteo' command."""
         self.first_command_received = True
         self.interface_manager.switch_to_slot_machine()
-        self.interface_manager.run()
 
     def handle_publicidad(self) -> None:
         """Handle the 'publicidad' command."""
         self.first_command_received = True
         self.interface_manager.switch_to_advertising()
-        self.interface_manager.run()
 
     def handle_button(self) -> None:
         """Handle the 'button' command."""
@@ -84,11 +96,10 @@ class Init:
         self.size_logo = (int(self.screen_width * 0.15), int(self.screen_height * 0.15))
         
         pygame.display.set_caption("BAYSI")
-        self.icon = pygame.image.load(f"{INIT_IMAGE_PATH}icon_plant.png")
+        self.icon = asset_manager.image("init", f"{INIT_IMAGE_PATH}icon_plant.png")
         pygame.display.set_icon(self.icon)
 
-        self.logo = pygame.image.load(f"{INIT_IMAGE_PATH}logo.png")
-        self.logo = pygame.transform.scale(self.logo, self.size_logo)
+        self.logo = asset_manager.image("init", f"{INIT_IMAGE_PATH}logo.png", self.size_logo)
         self.logo_rect = self.logo.get_rect(
             center=(self.screen_width // 2, self.screen_height // 2)
         )
@@ -119,9 +130,9 @@ class Init:
         self.place_holder_text = "Enter new IP"
 
         # Load and scale the settings icon
-        self.gear_icon = pygame.image.load(f"{INIT_IMAGE_PATH}setting.png")
-        self.gear_icon = pygame.transform.scale(
-            self.gear_icon,
+        self.gear_icon = asset_manager.image(
+            "init",
+            f"{INIT_IMAGE_PATH}setting.png",
             (int(self.button_size * 0.8), int(self.button_size * 0.8))
         )
 
@@ -147,79 +158,100 @@ class Init:
         """Stop the application and clean up resources."""
         self.running = False
         self.socket_client.stop()
+        self.shared_data.stop()
+        get_spin_ledger().stop()
+        get_counter_store().close()
+        get_playlist().stop()
+        close_pools()
         pygame.quit()
         sys.exit()
 
-    def run(self) -> None:
-        """Main method to start the application."""
-        self.show_initial_screen()
+    def process_events(self, events: list[pygame.event.Event]) -> None:
+        """
+        Handle pygame input and queued server commands in the same pass.
 
-        running = True
-        while running:
-            for event in pygame.event.get():
+        Args:
+            events (list[Event]): The events returned by the scheduler.
+        """
+        with frame_timer.stage("init.process_events"):
+            for event in events:
                 if event.type == pygame.QUIT:
-                    running = False
+                    self.running = False
+                elif event.type == CONNECTION_CHANGED:
+                    self.update_connection_state()
+                elif event.type != COMMAND_RECEIVED:
+                    self.interface_manager.handle_event(event)
 
-            # Check the command received from the server
-            command = self.socket_client.get_command()
-            if command:
-                self.interface_manager.handle_command(command)
-                self.interface_manager.run()
+            # COMMAND_RECEIVED only wakes the loop, the queue holds the commands
+            for command in self.socket_client.drain_commands():
+                self.dispatch_command(command)
+
+    def dispatch_command(self, command: str) -> None:
+        """
+        Run the callbacks of a server command and pass it to the interface manager.
+
+        Args:
+            command (str): The command to dispatch.
+        """
+        self.first_command_received = True
+        try:
+            self.socket_client.process_command(command)
+            self.interface_manager.handle_command(command)
+        except Exception as e:
+            # A bad command from a controller must not end the main loop
+            print(f"Error running command {command!r}: {e}")
+
+    def run(self) -> None:
+        """Main method to start the application.
+
+        One loop shows the initial screen until the first command, then the
+        interfaces. The scheduler runs it at the frame rate cap of what is
+        shown while it animates, and blocks on events otherwise.
+        """
+        while self.running:
+            if self.first_command_received:
+                animating = self.interface_manager.is_animating()
+                max_fps = self.interface_manager.max_fps()
+            else:
+                # The initial screen is a still image, redrawn on events only
+                animating, max_fps = False, 0
+            self.process_events(self.scheduler.wait(animating, max_fps))
+            if not self.running:
+                break
 
-            pygame.time.wait(100)
+            if self.first_command_received:
+                self.interface_manager.run()
+            else:
+                self.show_initial_screen()
 
         self.stop()
 
     def draw_gradient_surface(self, top_color: tuple[int, int, int], bottom_color: tuple[int, int, int]) -> None:
         """
-        Draw a gradient on the entire screen.
+        Select the gradient for the entire screen from the shared cache.
 
         Args:
             top_color (tuple[int, int, int]): The top color of the gradient.
             bottom_color (tuple[int, int, int]): The bottom color of the gradient.
         """
-        for i in range(self.screen_height):
-            color = (
-                int(
-                    top_color[0]
-                    + (bottom_color[0] - top_color[0]) * i / self.screen_height
-                ),
-                int(
-                    top_color[1]
-                    + (bottom_color[1] - top_color[1]) * i / self.screen_height
-                ),
-                int(
-                    top_color[2]
-                    + (bottom_color[2] - top_color[2]) * i / self.screen_height
-                ),
-            )
-            pygame.draw.line(
-                self.gradient_surface, color, (0, i), (self.screen_width, i)
-            )
-
-    def show_initial_screen(self) -> None:
-        """Show the initial screen in full screen mode."""
-        while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.stop()
-
-            # Update the connection state before drawing
-            self.update_connection_state()
-            
-            # Draw directly on the full screen
-            if self.connection_established:
-                self.draw_gradient_surface(CHARTREUSE, AQUAMARINE)
-            else:
-                self.draw_gradient_surface(AQUAMARINE, ORANGE_NEON)
+        self.gradient_surface = gradient_cache.get(
+            top_color, bottom_color, (self.screen_width, self.screen_height)
+        )
 
-            self.screen.blit(self.gradient_surface, (0, 0))
-            self.screen.blit(self.logo, self.logo_rect)
-            pygame.display.flip()
+    def draw_initial_screen(self) -> None:
+        """Draw the logo over the connection state gradient and present it."""
+        # Draw directly on the full screen
+        if self.connection_established:
+            self.draw_gradient_surface(CHARTREUSE, AQUAMARINE)
+        else:
+            self.draw_gradient_surface(AQUAMARINE, ORANGE_NEON)
 
-            command = self.socket_client.get_command()
-            if command:
-                self.interface_manager.handle_command(command)
-                break
+        self.screen.blit(self.gradient_surface, (0, 0))
+        self.screen.blit(self.logo, self.logo_rect)
+        pygame.display.flip()
 
-        self.interface_manager.run()
\ No newline at end of file
+    def show_initial_screen(self) -> None:
+        """Show the initial screen in full screen mode."""
+        # Update the connection state before drawing
+        self.update_connection_state()
+        self.draw_initial_screen()
\ No newline at end of file
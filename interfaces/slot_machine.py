@@ -1,9 +1,17 @@
 import pygame
 import random
-import sys
-
-from data.data_base import DataBase
-from data.internal_data import InternalData
+import time
+
+from data.state_store import get_state_store
+from data.spin_ledger import get_spin_ledger
+from data.counter_store import SPIN_COUNTER, get_counter_store
+from logic.asset_manager import asset_manager
+from logic.gradient_cache import gradient_cache
+from logic.message_overlay import MessageStyle, message_overlays
+from logic.sprite_atlas import SpriteAtlas
+from logic.compositor import Compositor
+from logic.frame_timer import frame_timer
+from logic.reel import Reel
 
 from assets.config import (
     AQUAMARINE,
@@ -13,7 +21,8 @@ from assets.config import (
     LINE_WIDHT,
     COOL_GRAY_LIGHT,
     COOL_GRAY_DARK,
-    FPS,
+    SPIN_STEPS_PER_SECOND,
+    SLOT_MACHINE_MAX_FPS,
     BLACK,
     SLOT_MACHINE_AUDIO_PATH,
     SLOT_MACHINE_FONT_PATH,
@@ -25,25 +34,18 @@ class SlotMachine:
     """Class to handle slot machine game interface."""
 
     def __init__(self) -> None:
-        """Initialize Pygame, set up the display, and load game assets."""
-        self.shared_data = DataBase()
-        self.internal_data = InternalData()
+        """Load game assets for the display surface opened by Init."""
+        self.shared_data = get_state_store()
+        self.ledger = get_spin_ledger()
+        self.counters = get_counter_store()
 
-        pygame.init()
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        self.screen = pygame.display.get_surface()
         self.WIDTH, self.HEIGHT = self.screen.get_width(), self.screen.get_height()
-        pygame.display.set_caption("Slot machine game")
-        self.icon = pygame.image.load(f"{SLOT_MACHINE_IMAGE_PATH}icon_plant.png")
-        pygame.display.set_icon(self.icon)
-        pygame.mouse.set_visible(False)
-        self.clock = pygame.time.Clock()
+        self.max_fps: int = SLOT_MACHINE_MAX_FPS
 
         self.delta_time: int = 0
 
-        self.gradient_surface = pygame.Surface((self.WIDTH, self.HEIGHT))
-        self.draw_gradient_surface(
-            self.gradient_surface, AQUAMARINE, ORANGE_NEON, self.WIDTH, self.HEIGHT
-        )
+        self.set_background(AQUAMARINE, ORANGE_NEON)
 
         self.frame_thickness: int = 60
 
@@ -52,43 +54,71 @@ class SlotMachine:
 
         self.border_radius: int = 15
 
-        self.slot_regular_images = [
-            pygame.image.load(f"{SLOT_MACHINE_IMAGE_PATH}image{i}.png").convert_alpha()
-            for i in range(1, 8)
-        ]
+        # Symbols and decorations are scaled and rotated once into one atlas,
+        # the reel lists below hold atlas keys instead of surfaces
+        self.symbol_size = (250, 250)
+        self.decoration_size = (100, 100)
+        self.atlas = SpriteAtlas()
+        for i in range(8):
+            image = asset_manager.image(
+                "slot_machine_atlas",
+                f"{SLOT_MACHINE_IMAGE_PATH}image{i + 1}.png",
+                self.symbol_size,
+            )
+            self.atlas.add(i, image)
 
-        self.slot_winner_images = [
-            pygame.image.load(f"{SLOT_MACHINE_IMAGE_PATH}image{i}.png").convert_alpha()
-            for i in range(1, 9)
-        ]
+        rotation_angles = [45, -45, 45, -45]
+        for i, angle in enumerate(rotation_angles):
+            image = asset_manager.image(
+                "slot_machine_atlas",
+                f"{SLOT_MACHINE_IMAGE_PATH}deco{i + 1}.png",
+                self.decoration_size,
+            )
+            self.atlas.add(("deco", i), pygame.transform.rotate(image, angle))
+        self.atlas.build()
+        # The atlas holds its own copy, the source images can be evicted
+        asset_manager.release("slot_machine_atlas")
+
+        self.slot_regular_images = list(range(7))
+        self.slot_winner_images = list(range(8))
 
         self.slot_images = self.slot_regular_images
 
         self.slots = [0, 0, 0]
+        self.reels = [Reel() for _ in range(3)]
+
+        # A spin goes through "spinning", "winning" (only for a winner),
+        # "reveal" and "result" before the game is "idle" again. It is
+        # advanced by update_spin() on every frame, never blocking the loop.
+        self.spin_phase: str = "idle"
+        self.spin_winner: bool = False
+        self.outcome: str = None
+        self.spin_timestamp: float = 0.0
+        self.spin_start: int = 0
+        self.phase_start: int = 0
+        self.last_update: int = 0
+        self.reveal_delay: int = 1000
+        self.result_display_time: int = 3000
+
+        self.spin_count = self.counters.get(SPIN_COUNTER)
 
-        self.spin_count = self.internal_data.get_counter()
-
-        self.slot_gradients = [
-            pygame.Surface((self.cell_width, self.cell_height), pygame.SRCALPHA)
-            for _ in range(3)
-        ]
-        for slot_surface in self.slot_gradients:
-            self.draw_gradient_surface(
-                slot_surface, ORANGE_NEON, CHARTREUSE, self.cell_width, self.cell_height
-            )
-
-        self.decoration_images = [
-            pygame.image.load(f"{SLOT_MACHINE_IMAGE_PATH}deco{i}.png").convert_alpha()
-            for i in range(1, 5)
-        ]
-        self.decoration_size = (100, 100)
-        self.decoration_images = [
-            pygame.transform.scale(img, self.decoration_size)
-            for img in self.decoration_images
-        ]
-
-        self.winner_sound = pygame.mixer.Sound(f"{SLOT_MACHINE_AUDIO_PATH}win.mp3")
-        self.lose_sound = pygame.mixer.Sound(f"{SLOT_MACHINE_AUDIO_PATH}lose.mp3")
+        self.change_colors(ORANGE_NEON, CHARTREUSE)
+        self.init_layout()
+
+        # Static background, grid and decorations are cached for the current
+        # color scheme, only the reels and the message overlay are redrawn on
+        # top of them. A single layer is kept, it is redrawn when colors change.
+        self.compositor = Compositor(self.screen)
+        self.static_layer = None
+        self.static_layer_key = None
+        self.drawn_slots = [None, None, None]
+        self.drawn_message = None
+        self.drawn_message_rect = None
+
+        # Acquired from the asset manager on resume and released on suspend
+        self.icon = None
+        self.winner_sound = None
+        self.lose_sound = None
 
         self.show_winner_message: bool = False
         self.winner_message_font_size: int = 150
@@ -108,6 +138,42 @@ class SlotMachine:
 
         self.init_joystick()
 
+    def init_layout(self) -> None:
+        """Compute every rect and position used by the grid and the reels."""
+        total_width = 3 * self.cell_width
+        total_height = self.cell_height
+        grid_x = (self.WIDTH - total_width) // 2
+        grid_y = (self.HEIGHT - total_height) // 2
+
+        self.cell_rects = [
+            pygame.Rect(
+                grid_x + col * self.cell_width, grid_y, self.cell_width, self.cell_height
+            )
+            for col in range(3)
+        ]
+        self.cell_positions = [rect.topleft for rect in self.cell_rects]
+
+        self.frame_rect = pygame.Rect(
+            grid_x - self.frame_thickness,
+            grid_y - self.frame_thickness,
+            total_width + 2 * self.frame_thickness,
+            total_height + 2 * self.frame_thickness,
+        )
+
+        self.decoration_positions = [
+            (("deco", 0), (grid_x - 50, grid_y - 50)),
+            (("deco", 1), (grid_x + total_width - 50, grid_y - 50)),
+            (("deco", 2), (grid_x - 50, grid_y + total_height - 100)),
+            (("deco", 3), (grid_x + total_width - 50, grid_y + total_height - 100)),
+        ]
+
+        self.slot_rects = [
+            pygame.Rect((0, 0), self.symbol_size) for _ in range(3)
+        ]
+        for rect, cell_rect in zip(self.slot_rects, self.cell_rects):
+            rect.center = cell_rect.center
+        self.slot_positions = [rect.topleft for rect in self.slot_rects]
+
     def init_joystick(self) -> None:
         """Initialize the joystick if available."""
         pygame.joystick.init()
@@ -124,7 +190,8 @@ class SlotMachine:
         Returns:
             str: The current state of the button.
         """
-        button_state = self.shared_data.get_value_state("active_button")
+        with frame_timer.stage("slot_machine.get_state"):
+            button_state = self.shared_data.get_value_state("active_button")
         return button_state
 
     def is_winner_attemp(self) -> bool:
@@ -139,91 +206,137 @@ class SlotMachine:
         else:
             return False
 
-    def draw_gradient_surface(
-        self,
-        surface: pygame.Surface,
-        color_top: tuple[int, int, int],
-        color_bottom: tuple[int, int, int],
-        width: int,
-        height: int,
-    ) -> None:
-        """Draw a gradient background on the given surface."""
-        for i in range(height):
-            color = (
-                color_top[0] + (color_bottom[0] - color_top[0]) * i / height,
-                color_top[1] + (color_bottom[1] - color_top[1]) * i / height,
-                color_top[2] + (color_bottom[2] - color_top[2]) * i / height,
-            )
-            pygame.draw.line(surface, color, (0, i), (width, i))
-
-    def draw_grid(self) -> None:
-        """Draw the grid for the slot machine."""
-        total_width = 3 * self.cell_width
-        total_height = self.cell_height
-        grid_x = (self.WIDTH - total_width) // 2
-        grid_y = (self.HEIGHT - total_height) // 2
+    def is_animating(self) -> bool:
+        """
+        Check if the screen changes without any event, during a spin.
 
-        for col in range(3):
-            x = grid_x + col * self.cell_width
-            y = grid_y
-            cell_bg_rect = (x, y, self.cell_width, self.cell_height)
+        Returns:
+            bool: True while a spin is in progress.
+        """
+        return self.spin_phase != "idle"
 
-            clip_rect = pygame.Rect(x, y, self.cell_width, self.cell_height)
-            self.screen.set_clip(clip_rect)
-            self.screen.blit(self.slot_gradients[col], (x, y))
-            self.screen.set_clip(None)
+    def set_background(
+        self, color_top: tuple[int, int, int], color_bottom: tuple[int, int, int]
+    ) -> None:
+        """Select the full-screen gradient background from the shared cache."""
+        self.background_colors = (color_top, color_bottom)
+        self.gradient_surface = gradient_cache.get(
+            color_top, color_bottom, (self.WIDTH, self.HEIGHT)
+        )
 
+    def draw_grid(self, surface: pygame.Surface) -> None:
+        """Draw the grid for the slot machine on the given surface."""
+        for cell_rect, position in zip(self.cell_rects, self.cell_positions):
+            surface.blit(self.slot_gradient, position)
             pygame.draw.rect(
-                self.screen,
+                surface,
                 COOL_GRAY_LIGHT,
-                cell_bg_rect,
+                cell_rect,
                 LINE_WIDHT,
                 border_radius=self.border_radius,
             )
 
-        frame_rect = (
-            grid_x - self.frame_thickness,
-            grid_y - self.frame_thickness,
-            total_width + 2 * self.frame_thickness,
-            total_height + 2 * self.frame_thickness,
-        )
         pygame.draw.rect(
-            self.screen,
+            surface,
             COOL_GRAY_DARK,
-            frame_rect,
+            self.frame_rect,
             self.frame_thickness,
             border_radius=self.border_radius - 5,
         )
 
-        corners = [
-            (grid_x - 50, grid_y - 50),
-            (grid_x + total_width - 50, grid_y - 50),
-            (grid_x - 50, grid_y + total_height - 100),
-            (grid_x + total_width - 50, grid_y + total_height - 100),
-        ]
-        rotation_angles = [45, -45, 45, -45]
+        for key, position in self.decoration_positions:
+            self.atlas.blit(surface, key, position)
 
-        for corner, angle, image in zip(
-            corners, rotation_angles, self.decoration_images
-        ):
-            rotated_image = pygame.transform.rotate(image, angle)
-            image_rect = rotated_image.get_rect(topleft=corner)
-            self.screen.blit(rotated_image, image_rect.topleft)
+    def get_static_layer(self) -> pygame.Surface:
+        """
+        Get the cached background, grid and decorations for the current colors.
 
-    def draw_slots(self) -> None:
-        for i in range(3):
-            x = (self.WIDTH - 3 * self.cell_width) // 2 + i * self.cell_width
-            y = (self.HEIGHT - self.cell_height) // 2
+        Returns:
+            Surface: A screen-sized surface with everything that does not move.
+        """
+        key = (self.background_colors, self.cell_colors)
+        if key != self.static_layer_key:
+            with frame_timer.stage("slot_machine.draw_grid"):
+                layer = self.gradient_surface.copy()
+                self.draw_grid(layer)
+            self.static_layer = layer
+            self.static_layer_key = key
+        return self.static_layer
+
+    def draw_slots(self) -> list[bool]:
+        """
+        Draw the reels that moved since they were last drawn.
 
-            reduced_size = (250, 250)
-            slot_image = pygame.transform.scale(
-                self.slot_winner_images[self.slots[i]], reduced_size
-            )
+        A reel between two symbols shows the current one scrolling down and
+        the next one coming in from the top, clipped to the symbol area.
 
-            image_rect = slot_image.get_rect(
-                center=(x + self.cell_width // 2, y + self.cell_height // 2)
-            )
-            self.screen.blit(slot_image, image_rect.topleft)
+        Returns:
+            list[bool]: Which reels were drawn.
+        """
+        drawn = [False, False, False]
+        for i in range(3):
+            state = (self.slots[i], self.reels[i].offset)
+            if state != self.drawn_slots[i]:
+                rect = self.slot_rects[i]
+                self.compositor.restore(rect)
+                shift = round(state[1] * rect.height)
+                if shift:
+                    following = (self.slots[i] + 1) % len(self.slot_images)
+                    self.screen.set_clip(rect)
+                    self.atlas.blit(
+                        self.screen,
+                        self.slot_winner_images[self.slots[i]],
+                        (rect.x, rect.y + shift),
+                    )
+                    self.atlas.blit(
+                        self.screen,
+                        self.slot_winner_images[following],
+                        (rect.x, rect.y + shift - rect.height),
+                    )
+                    self.screen.set_clip(None)
+                else:
+                    self.atlas.blit(
+                        self.screen,
+                        self.slot_winner_images[self.slots[i]],
+                        self.slot_positions[i],
+                    )
+                self.drawn_slots[i] = state
+                drawn[i] = True
+        return drawn
+
+    def render(self) -> None:
+        """Compose the current frame and present only the areas that changed."""
+        self.compositor.set_static_layer(self.get_static_layer())
+        with frame_timer.stage("slot_machine.static_layer"):
+            full_redraw = self.compositor.begin_frame()
+
+        message = (self.show_winner_message, self.show_loss_message)
+        message_rect = self.drawn_message_rect
+        message_changed = message != self.drawn_message
+        if full_redraw:
+            self.drawn_slots = [None, None, None]
+        elif message_changed and message_rect:
+            # Erase the old overlay and redraw the reels it was covering
+            self.compositor.restore(message_rect)
+            for i, rect in enumerate(self.slot_rects):
+                if message_rect.colliderect(rect):
+                    self.drawn_slots[i] = None
+
+        with frame_timer.stage("slot_machine.draw_slots"):
+            drawn = self.draw_slots()
+        covered = message_rect is not None and any(
+            redrawn and message_rect.colliderect(rect)
+            for redrawn, rect in zip(drawn, self.slot_rects)
+        )
+        if full_redraw or message_changed or covered:
+            self.drawn_message = message
+            with frame_timer.stage("slot_machine.display_final_message"):
+                self.drawn_message_rect = self.display_final_message()
+            if self.drawn_message_rect:
+                self.compositor.mark_dirty(self.drawn_message_rect)
+
+        with frame_timer.stage("slot_machine.present"):
+            self.compositor.present()
 
     def display_message(
         self,
@@ -237,96 +350,115 @@ class SlotMachine:
         background_color: tuple[int, int, int],
         inside_border_color: tuple[int, int, int],
         message: str,
-    ) -> None:
+    ) -> pygame.Rect:
         if state_message:
-            font = pygame.font.Font(self.font_path, font_size)
-            winner_text = font.render(message, True, font_color)
-            text_rect = winner_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
-
-            rect_width = text_rect.width + 2 * padding
-            rect_height = text_rect.height + 2 * padding
-            rect_x = text_rect.centerx - rect_width // 2
-            rect_y = text_rect.centery - rect_height // 2
-            rect = pygame.Rect(rect_x, rect_y, rect_width, rect_height)
-
-            border_rect = pygame.Rect(
-                rect_x - border_thickness,
-                rect_y - border_thickness,
-                rect_width + 2 * border_thickness,
-                rect_height + 2 * border_thickness,
-            )
-            pygame.draw.rect(
-                self.screen,
-                outside_border_color,
-                border_rect,
-                0,
-                border_radius + 5,
-            )
-
-            pygame.draw.rect(self.screen, background_color, rect, 0, border_radius)
-
-            pygame.draw.rect(
-                self.screen,
-                inside_border_color,
-                rect,
+            # Text, background and borders are rendered once into one surface
+            style = MessageStyle(
+                self.font_path,
+                font_size,
+                padding,
                 border_thickness,
                 border_radius,
+                font_color,
+                outside_border_color,
+                background_color,
+                inside_border_color,
             )
-
-            # Display winner text
-            self.screen.blit(winner_text, text_rect.topleft)
+            overlay, border_rect = message_overlays.get(
+                message, style, (self.WIDTH, self.HEIGHT)
+            )
+            self.screen.blit(overlay, border_rect)
+            return border_rect
+        return None
 
     def change_colors(
         self, color_top: tuple[int, int, int], color_bottom: tuple[int, int, int]
     ) -> None:
-        for slot_surface in self.slot_gradients:
-            self.draw_gradient_surface(
-                slot_surface, color_top, color_bottom, self.cell_width, self.cell_height
-            )
+        self.cell_colors = (color_top, color_bottom)
+        self.slot_gradient = gradient_cache.get(
+            color_top, color_bottom, (self.cell_width, self.cell_height)
+        )
 
     def spin_slots(self) -> None:
-
+        """Start a spin, it is then advanced by update_spin() on every frame."""
         self.slot_images = self.slot_regular_images
+        self.spin_timestamp = time.time()
+        now = pygame.time.get_ticks()
+        self.spin_start = self.phase_start = self.last_update = now
 
-        spin_time = [random.randint(3000, 5000) for _ in range(3)]
-        start_time = [
-            pygame.time.get_ticks() + random.randint(0, 500) for _ in range(3)
-        ]
-        end_time = [st + spin for st, spin in zip(start_time, spin_time)]
-        finished_slots = [False] * 3
-        running = True
+        # Each reel spins 3 to 5 seconds, starting up to half a second late
+        for reel in self.reels:
+            reel.spin_until(now + random.randint(0, 500) + random.randint(3000, 5000))
+        self.spin_phase = "spinning"
 
         self.change_colors(ORANGE_NEON, CHARTREUSE)
-        self.draw_gradient_surface(
-            self.gradient_surface, AQUAMARINE, ORANGE_NEON, self.WIDTH, self.HEIGHT
-        )
+        self.set_background(AQUAMARINE, ORANGE_NEON)
         self.shared_data.set_value_game_state("state", "PROCESANDO...")
 
-        while running:
-            current_time = pygame.time.get_ticks()
-            running = False
-            for i in range(3):
-                if current_time < end_time[i]:
-                    running = True
-                    self.slots[i] = (self.slots[i] + 1) % len(self.slot_images)
+    def advance_reels(self, now: int) -> None:
+        """Scroll the reels by the time elapsed since the previous frame."""
+        steps = (now - self.last_update) * SPIN_STEPS_PER_SECOND / 1000
+        self.last_update = now
+        for i, reel in enumerate(self.reels):
+            passed = int(reel.position)
+            reel.advance(now, steps)
+            if int(reel.position) != passed:
+                self.slots[i] = (self.slots[i] + int(reel.position) - passed) % len(
+                    self.slot_images
+                )
+
+    def update_spin(self, now: int) -> None:
+        """
+        Advance the spin in progress to the given time.
+
+        Args:
+            now (int): Current tick in ms, from pygame.time.get_ticks().
+        """
+        with frame_timer.stage("slot_machine.update_spin"):
+            self.advance_reels(now)
+            stopped = all(reel.stopped for reel in self.reels)
+
+            if self.spin_phase == "spinning" and stopped:
+                self.spin_winner = self.is_winner_attemp()
+                if self.spin_winner:
+                    # Every reel keeps turning until it shows the winner symbol
+                    self.slot_images = self.slot_winner_images
+                    winner_frame = 7
+                    for reel, slot in zip(self.reels, self.slots):
+                        reel.move_by((winner_frame - slot) % len(self.slot_winner_images))
+                    self.spin_phase = "winning"
                 else:
-                    finished_slots[i] = True
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-            self.screen.blit(self.gradient_surface, (0, 0))
-            self.draw_grid()
-            self.draw_slots()
-            pygame.display.flip()
-            self.clock.tick(FPS // 5)
-
-        if self.is_winner_attemp():
-            self.slot_images = self.slot_winner_images
-            self.spin_to_winner()
-            pygame.time.delay(1000)
+                    self.spin_phase = "reveal"
+                    self.phase_start = now
+
+            elif self.spin_phase == "winning" and stopped:
+                self.slot_images = self.slot_regular_images
+                self.spin_phase = "reveal"
+                self.phase_start = now
+
+            elif self.spin_phase == "reveal" and now - self.phase_start >= self.reveal_delay:
+                self.show_result()
+                # Recorded with the published outcome, a spin stopped while
+                # its result is displayed is still in the ledger
+                self.ledger.record(
+                    self.spin_timestamp,
+                    self.spin_count,
+                    self.slots,
+                    self.outcome,
+                    now - self.spin_start,
+                )
+                self.spin_phase = "result"
+                self.phase_start = now
+
+            elif (
+                self.spin_phase == "result"
+                and now - self.phase_start >= self.result_display_time
+            ):
+                self.spin_phase = "idle"
+
+    def show_result(self) -> None:
+        """Show the outcome of the spin and publish it."""
+        if self.spin_winner:
             self.change_colors(CHARTREUSE, AQUAMARINE)
             self.winner_sound.play()
             self.show_winner_message = True
@@ -337,88 +469,75 @@ class SlotMachine:
                 int(self.winner_sound.get_length() * 1000)
                 + self.additional_display_time,
             )
-            self.internal_data.set_env_variable("COUNTER", "1")
-            self.shared_data.set_value_game_state("state", "GANADOR")
+            self.counters.set(SPIN_COUNTER, 1)
+            self.outcome = "GANADOR"
         else:
-            self.slot_images = self.slot_regular_images
-            self.stop_slots(finished_slots)
-            pygame.time.delay(1000)
-            self.draw_gradient_surface(
-                self.gradient_surface, ORANGE_NEON, ORANGE_NEON, self.WIDTH, self.HEIGHT
-            )
+            self.set_background(ORANGE_NEON, ORANGE_NEON)
             self.lose_sound.play()
             self.show_loss_message = True
             self.show_winner_message = False
             pygame.time.set_timer(pygame.USEREVENT, self.additional_display_time + 3500)
-            self.shared_data.set_value_game_state("state", "PERDEDOR")
+            self.outcome = "PERDEDOR"
 
-        self.display_final_result()
+        self.shared_data.set_many(
+            {("game_state", "state"): self.outcome, ("state", "active_button"): "False"}
+        )
 
-    def spin_to_winner(self) -> None:
-        winner_frame = 7
-        steps_needed = [
-            (winner_frame - slot) % len(self.slot_winner_images) for slot in self.slots
-        ]
+    def load_assets(self) -> None:
+        """Acquire the icon and the sounds of the game."""
+        self.icon = asset_manager.image(
+            "slot_machine", f"{SLOT_MACHINE_IMAGE_PATH}icon_plant.png"
+        )
+        self.winner_sound = asset_manager.sound(
+            "slot_machine", f"{SLOT_MACHINE_AUDIO_PATH}win.mp3"
+        )
+        self.lose_sound = asset_manager.sound(
+            "slot_machine", f"{SLOT_MACHINE_AUDIO_PATH}lose.mp3"
+        )
 
-        running = True
-        while running:
-            running = False
-            for i in range(3):
-                if steps_needed[i] > 0:
-                    running = True
-                    self.slots[i] = (self.slots[i] + 1) % len(self.slot_winner_images)
-                    steps_needed[i] -= 1
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-            self.screen.blit(self.gradient_surface, (0, 0))
-            self.draw_grid()
-            self.draw_slots()
-            pygame.display.flip()
-            self.clock.tick(FPS // 5)
+    def stop_sounds(self) -> None:
+        """Stop the result sounds if they are playing."""
+        if self.winner_sound:
+            self.winner_sound.stop()
+        if self.lose_sound:
+            self.lose_sound.stop()
 
-        self.slot_images = self.slot_regular_images
+    def suspend(self) -> None:
+        """Pause the game while another interface is shown.
 
-    def stop_slots(self, finished_slots: list[bool]) -> None:
+        The reel atlas and the cached layers are kept, the icon and sounds
+        are given back to the asset manager.
+        """
+        self.stop_sounds()
+        self.show_winner_message = False
+        self.show_loss_message = False
+        self.icon = self.winner_sound = self.lose_sound = None
+        asset_manager.release("slot_machine")
 
-        winners = [
-            random.randint(0, len(self.slot_regular_images) - 1) for _ in range(3)
-        ]
-        for i in range(3):
-            if not finished_slots[i]:
-                self.slots[i] = winners[i]
-
-    def display_final_result(self) -> None:
-        for i in reversed(range(3)):
-            slot_end_time = pygame.time.get_ticks() + (3 - i) * 500
-            while pygame.time.get_ticks() < slot_end_time:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-
-                self.screen.blit(self.gradient_surface, (0, 0))
-                self.draw_grid()
-                self.draw_slots()
-                pygame.display.flip()
-                self.clock.tick(FPS)
+    def resume(self) -> None:
+        """Take over the display again after being suspended."""
+        self.load_assets()
+        pygame.display.set_caption("Slot machine game")
+        pygame.display.set_icon(self.icon)
+        pygame.mouse.set_visible(False)
+        # Another interface drew over the screen, nothing on it can be reused
+        self.compositor.invalidate()
 
     def stop(self) -> None:
         """Stop the slot machine game and clean up resources."""
-        self.winner_sound.stop()
-        self.lose_sound.stop()
+        self.stop_sounds()
         self.running = False
         self.show_winner_message = False
         self.show_loss_message = False
         # Reset game state
         self.slots = [0, 0, 0]
-        self.spin_count = self.internal_data.get_counter()
+        self.reels = [Reel() for _ in range(3)]
+        self.spin_phase = "idle"
+        self.slot_images = self.slot_regular_images
+        self.spin_count = self.counters.get(SPIN_COUNTER)
 
-    def display_final_message(self) -> None:
-        self.display_message(
+    def display_final_message(self) -> pygame.Rect:
+        winner_rect = self.display_message(
             self.show_winner_message,
             self.winner_message_font_size,
             self.winner_message_rect_padding,
@@ -431,7 +550,7 @@ class SlotMachine:
             "¡ GANADOR !",
         )
 
-        self.display_message(
+        loss_rect = self.display_message(
             self.show_loss_message,
             self.loss_message_font_size,
             self.loss_message_rect_padding,
@@ -443,38 +562,39 @@ class SlotMachine:
             CHARTREUSE,
             "¡ Suerte la Próxima !",
         )
+        return winner_rect or loss_rect
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Handle an input event dispatched by the main loop.
+
+        Args:
+            event (Event): The pygame event to handle.
+        """
+        if event.type == pygame.JOYBUTTONDOWN and event.button == 0:
+            if self.spin_phase == "idle" and self.get_state() == "True":
+                # The attempt keeps the count before this press
+                self.spin_count = self.counters.increment(SPIN_COUNTER) - 1
+                self.spin_slots()
+
+        elif event.type == pygame.USEREVENT:
+            self.show_winner_message = False
+            self.show_loss_message = False
 
     def run(self, screen) -> None:
         """Run the slot machine game loop."""
         self.running = True
         self.start_time = pygame.time.get_ticks()
-        counter = self.internal_data.get_counter()
 
         if not hasattr(self, 'screen'):
             self.screen = screen
 
-        state_button = self.get_state()
-        if state_button == "True":
-            for event in pygame.event.get():
-                if event.type == pygame.JOYBUTTONDOWN and event.button == 0:
-                    self.spin_count = counter = self.internal_data.get_counter()
-                    counter += 1
-                    self.internal_data.set_env_variable("COUNTER", f"{counter}")
-                    self.spin_slots()
-                    self.shared_data.set_value_state("active_button", "False")
-
-                if event.type == pygame.USEREVENT:
-                    self.show_winner_message = False
-                    self.show_loss_message = False
-
-        self.draw_gradient_surface(
-            self.gradient_surface, AQUAMARINE, ORANGE_NEON, self.WIDTH, self.HEIGHT
-        )
+        if self.spin_phase != "idle":
+            self.update_spin(self.start_time)
+        if self.spin_phase == "idle":
+            self.set_background(AQUAMARINE, ORANGE_NEON)
         self.delta_time = (pygame.time.get_ticks() - self.start_time) / 1000
-        screen.blit(self.gradient_surface, (0, 0))
-        self.draw_grid()
-        self.draw_slots()
-        self.display_final_message()
+        self.render()
 
 if __name__ == "__main__":
     slot_machine = SlotMachine()
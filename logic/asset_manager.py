@@ -0,0 +1,155 @@
+from collections import OrderedDict
+
+import pygame
+
+from assets.config import ASSET_CACHE_MAX_BYTES
+
+
+class AssetManager:
+    """Class to load images, sounds and fonts once and share them between interfaces.
+
+    Assets are loaded the first time an interface acquires them and are
+    deduplicated by path and size, images are converted to the display
+    format. Each interface holds a reference on what it acquired and gives
+    it back with release() when it is suspended. Assets nobody holds are
+    kept in an LRU, within a memory cap, so resuming an interface does not
+    decode its files again.
+    """
+
+    def __init__(self, max_unused_bytes: int = ASSET_CACHE_MAX_BYTES) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_unused_bytes (int): Memory kept by assets no interface holds.
+        """
+        self.max_unused_bytes = max_unused_bytes
+        self.assets: dict = {}
+        self.references: dict = {}
+        self.owners: dict[str, set] = {}
+        self.unused: OrderedDict = OrderedDict()  # Keys with no reference, LRU
+        self.unused_bytes = 0
+        self.fonts: dict = {}
+
+    @staticmethod
+    def load_image(path: str, size: tuple[int, int], alpha: bool) -> pygame.Surface:
+        """Load an image, scale it and convert it to the display format."""
+        surface = pygame.image.load(path)
+        if size is not None and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        return surface
+
+    def image(
+        self, owner: str, path: str, size: tuple[int, int] = None, alpha: bool = True
+    ) -> pygame.Surface:
+        """
+        Acquire an image, loading it on first use.
+
+        Args:
+            owner (str): Name of the interface holding the reference.
+            path (str): Path of the image file.
+            size (tuple[int, int]): Size to scale the image to, None to keep it.
+            alpha (bool): Keep per-pixel transparency.
+
+        Returns:
+            Surface: The shared surface, it must only be blitted.
+        """
+        size = tuple(size) if size is not None else None
+        return self.acquire(
+            owner, ("image", path, size, alpha), lambda: self.load_image(path, size, alpha)
+        )
+
+    def sound(self, owner: str, path: str) -> pygame.mixer.Sound:
+        """
+        Acquire a sound, loading it on first use.
+
+        Args:
+            owner (str): Name of the interface holding the reference.
+            path (str): Path of the sound file.
+
+        Returns:
+            Sound: The shared sound.
+        """
+        return self.acquire(owner, ("sound", path), lambda: pygame.mixer.Sound(path))
+
+    def font(self, path: str, size: int) -> pygame.font.Font:
+        """
+        Get a font, loading it once per file and size.
+
+        Fonts are small and kept for the whole session.
+
+        Args:
+            path (str): Path of the font file, None for the default font.
+            size (int): Font size in pixels.
+
+        Returns:
+            Font: The shared font.
+        """
+        font = self.fonts.get((path, size))
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[(path, size)] = font
+        return font
+
+    def acquire(self, owner: str, key: tuple, load):
+        """Return the asset of a key, loading it, and count the owner's reference."""
+        asset = self.assets.get(key)
+        if asset is None:
+            asset = load()
+            self.assets[key] = asset
+            self.references[key] = 0
+        elif key in self.unused:
+            del self.unused[key]
+            self.unused_bytes -= self.asset_bytes(asset)
+
+        held = self.owners.setdefault(owner, set())
+        if key not in held:
+            held.add(key)
+            self.references[key] += 1
+        return asset
+
+    def release(self, owner: str) -> None:
+        """
+        Drop every reference of an interface.
+
+        Args:
+            owner (str): Name of the interface, as given when acquiring.
+        """
+        for key in self.owners.pop(owner, ()):
+            self.references[key] -= 1
+            if self.references[key] == 0:
+                self.unused[key] = True
+                self.unused_bytes += self.asset_bytes(self.assets[key])
+        self.evict()
+
+    def evict(self) -> None:
+        """Free least recently released assets until the unused ones fit the cap."""
+        while self.unused_bytes > self.max_unused_bytes and self.unused:
+            key, _ = self.unused.popitem(last=False)
+            self.unused_bytes -= self.asset_bytes(self.assets.pop(key))
+            del self.references[key]
+
+    def clear(self) -> None:
+        """Forget every asset, for example after the display mode changed."""
+        self.assets.clear()
+        self.references.clear()
+        self.owners.clear()
+        self.unused.clear()
+        self.unused_bytes = 0
+        self.fonts.clear()
+
+    @staticmethod
+    def asset_bytes(asset) -> int:
+        """Return the memory used by a surface or a sound."""
+        if isinstance(asset, pygame.Surface):
+            return asset.get_pitch() * asset.get_height()
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            return 0
+        frequency, size, channels = mixer
+        return int(asset.get_length() * frequency * channels * abs(size) // 8)
+
+
+# Shared by every interface so the same file is only loaded once
+asset_manager = AssetManager()
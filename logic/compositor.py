@@ -0,0 +1,68 @@
+import pygame
+
+
+class Compositor:
+    """Class to draw over a cached static layer and present only changed rects."""
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        """Initialize the compositor for the given display surface.
+
+        Args:
+            screen (Surface): The display surface to compose on.
+        """
+        self.screen = screen
+        self.static_layer = None
+        self.dirty_rects: list = []
+        self.full_redraw = True
+
+    def set_static_layer(self, surface: pygame.Surface) -> None:
+        """Set the layer drawn under every dynamic element.
+
+        Args:
+            surface (Surface): A screen-sized surface with the static content.
+        """
+        if surface is not self.static_layer:
+            self.static_layer = surface
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force the next frame to repaint and present the whole screen."""
+        self.full_redraw = True
+
+    def begin_frame(self) -> bool:
+        """Start a frame, repainting the static layer if needed.
+
+        Returns:
+            bool: True if the whole screen was repainted and every dynamic
+            element has to be drawn again.
+        """
+        if not self.full_redraw:
+            return False
+        self.screen.blit(self.static_layer, (0, 0))
+        return True
+
+    def restore(self, rect: pygame.Rect) -> None:
+        """Repaint an area from the static layer and mark it as changed.
+
+        Args:
+            rect (Rect): The screen area to restore.
+        """
+        self.screen.blit(self.static_layer, rect, rect)
+        self.dirty_rects.append(rect)
+
+    def mark_dirty(self, rect: pygame.Rect) -> None:
+        """Mark an area drawn by the caller as changed.
+
+        Args:
+            rect (Rect): The screen area that changed.
+        """
+        self.dirty_rects.append(rect)
+
+    def present(self) -> None:
+        """Push the changed areas to the display."""
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        elif self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
+        self.dirty_rects.clear()
@@ -0,0 +1,29 @@
+import pygame
+
+# Custom pygame event types shared by every interface
+
+# Posted when a state key changes, with the attributes table, key and value
+STATE_CHANGED: int = pygame.event.custom_type()
+
+# Posted when the server queues a command, to wake up the main loop
+COMMAND_RECEIVED: int = pygame.event.custom_type()
+
+# Posted when the first controller connects or the last one disconnects
+CONNECTION_CHANGED: int = pygame.event.custom_type()
+
+
+def post_event(event_type: int, **attributes) -> None:
+    """Post a custom event if the pygame event queue is available.
+
+    Safe to call from any thread.
+
+    Args:
+        event_type (int): The custom event type.
+        **attributes: Attributes attached to the event.
+    """
+    if not pygame.display.get_init():
+        return
+    try:
+        pygame.event.post(pygame.event.Event(event_type, **attributes))
+    except pygame.error as e:
+        print(f"Error posting event: {e}")
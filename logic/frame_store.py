@@ -0,0 +1,128 @@
+import mmap
+import os
+import struct
+from typing import Iterable
+
+import numpy as np
+
+# Layout of a frame store file:
+#   header: magic, width, height, fps, frame count (little endian)
+#   padding up to HEADER_SIZE, where the frame data starts
+#   frames: count * height * width * 3 bytes of packed RGB, row major
+MAGIC = b"FRM1"
+HEADER = struct.Struct("<4sIIdI")
+# Fixed rather than the page size of the writer, so a store baked on one
+# machine reads the same on hosts with 4 KiB or 16 KiB pages
+HEADER_SIZE = 4096
+
+
+class FrameStoreError(ValueError):
+    """Raised when a file is not a valid frame store."""
+
+
+def write_frame_store(
+    path: str, frames: Iterable[np.ndarray], size: tuple[int, int], fps: float
+) -> int:
+    """
+    Write raw RGB frames into a frame store file.
+
+    Args:
+        path (str): File to write.
+        frames (Iterable[ndarray]): (height, width, 3) uint8 frames.
+        size (tuple[int, int]): Width and height every frame must have.
+        fps (float): Rate the frames are played at.
+
+    Returns:
+        int: The number of frames written.
+    """
+    width, height = size
+    count = 0
+    with open(path, "wb") as file:
+        file.write(bytes(HEADER_SIZE))
+        for frame in frames:
+            if frame.shape != (height, width, 3):
+                raise FrameStoreError(
+                    f"Frame of shape {frame.shape} in a {width}x{height} store"
+                )
+            file.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+            count += 1
+        # The count is only known at the end, the header is written last
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, width, height, fps, count))
+    return count
+
+
+class FrameStore:
+    """Class to read the frames of a frame store through a memory map.
+
+    Frames are NumPy views of the mapped pages, nothing is decoded or copied
+    until they are uploaded to a surface, and the pages stay in the OS page
+    cache between runs.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Map a frame store file.
+
+        Args:
+            path (str): The frame store file.
+
+        Raises:
+            FrameStoreError: If the file is truncated or not a frame store.
+        """
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise FrameStoreError(f"{path} is too short to be a frame store")
+            magic, self.width, self.height, self.fps, self.count = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise FrameStoreError(f"{path} is not a frame store")
+
+            self.frame_bytes = self.width * self.height * 3
+            expected = HEADER_SIZE + self.count * self.frame_bytes
+            if os.fstat(file.fileno()).st_size < expected or not self.count:
+                raise FrameStoreError(f"{path} is truncated")
+            self.map = mmap.mmap(file.fileno(), expected, access=mmap.ACCESS_READ)
+
+        if hasattr(self.map, "madvise"):
+            # Playback reads front to back, let the kernel read ahead
+            self.map.madvise(mmap.MADV_SEQUENTIAL)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Width and height of the frames."""
+        return self.width, self.height
+
+    @property
+    def duration(self) -> float:
+        """Playing time of the stored frames in seconds."""
+        return self.count / self.fps
+
+    def frame(self, index: int) -> np.ndarray:
+        """
+        Return a read-only view of a frame.
+
+        Args:
+            index (int): Position of the frame.
+
+        Returns:
+            ndarray: The (height, width, 3) frame, backed by the mapped file.
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f"Frame {index} out of range")
+        return np.frombuffer(
+            self.map,
+            dtype=np.uint8,
+            count=self.frame_bytes,
+            offset=HEADER_SIZE + index * self.frame_bytes,
+        ).reshape(self.height, self.width, 3)
+
+    def close(self) -> None:
+        """Unmap the file, unless frames handed out are still referenced."""
+        try:
+            self.map.close()
+        except BufferError:
+            # The views keep the mapping alive, it is released with the last one
+            pass
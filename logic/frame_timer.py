@@ -0,0 +1,169 @@
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pygame
+
+from assets.config import FRAME_TIMING_ENABLED, FRAME_TIMING_WINDOW
+from logic.asset_manager import asset_manager
+from logic.stats import histogram, percentile
+
+# Returned while timing is disabled, entering it costs next to nothing
+NULL_STAGE = nullcontext()
+
+
+class StageTimer:
+    """Context manager timing one stage into its rolling window of samples."""
+
+    __slots__ = ("samples", "started")
+
+    def __init__(self, window: int) -> None:
+        self.samples = deque(maxlen=window)
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.samples.append(time.perf_counter() - self.started)
+
+    def summary(self) -> dict:
+        """Return percentiles in ms and a log-scale histogram of the window."""
+        values = sorted(sample * 1e6 for sample in self.samples)
+        return {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 0.50) / 1000, 3),
+            "p95_ms": round(percentile(values, 0.95) / 1000, 3),
+            "p99_ms": round(percentile(values, 0.99) / 1000, 3),
+            "max_ms": round(values[-1] / 1000, 3),
+            "histogram": {
+                key: count for key, count in histogram(values).items() if count
+            },
+        }
+
+
+class FrameTimer:
+    """Class to time the stages of the render loop.
+
+    Code wraps a stage in `with frame_timer.stage("name"):`. While timing is
+    disabled the same no-op context is returned for every stage, so the
+    instrumentation can stay in the hot paths.
+    """
+
+    def __init__(
+        self, enabled: bool = FRAME_TIMING_ENABLED, window: int = FRAME_TIMING_WINDOW
+    ) -> None:
+        """Initialize the timer.
+
+        Args:
+            enabled (bool): Whether stages are timed.
+            window (int): Samples kept per stage.
+        """
+        self.enabled = enabled
+        self.window = window
+        self.stages: dict[str, StageTimer] = {}
+        self.overlay = False
+        self.overlay_rect = None
+
+    def stage(self, name: str):
+        """
+        Get the context manager timing a stage.
+
+        Args:
+            name (str): Name of the stage, for example "slot_machine.draw_slots".
+
+        Returns:
+            The stage timer, or a no-op context while timing is disabled.
+        """
+        if not self.enabled:
+            return NULL_STAGE
+        timer = self.stages.get(name)
+        if timer is None:
+            timer = self.stages[name] = StageTimer(self.window)
+        return timer
+
+    def summary(self) -> dict:
+        """Return the statistics of every stage that has samples."""
+        return {
+            name: timer.summary()
+            for name, timer in sorted(self.stages.items())
+            if timer.samples
+        }
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self.stages.clear()
+
+    def draw_overlay(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Draw the p50, p95 and max of every stage in the top left corner.
+
+        The box keeps the largest size it was drawn at, so each frame fully
+        covers the previous one.
+
+        Args:
+            screen (Surface): The surface to draw on.
+
+        Returns:
+            Rect: The area drawn, to be presented by the caller.
+        """
+        font = asset_manager.font(None, 20)
+        rows = [("stage ms", "p50", "p95", "max")]
+        for name, stats in self.summary().items():
+            rows.append(
+                (name, *(f"{stats[key]:.2f}" for key in ("p50_ms", "p95_ms", "max_ms")))
+            )
+        rendered = [
+            [font.render(cell, True, (255, 255, 255)) for cell in row] for row in rows
+        ]
+
+        # The stage names are left aligned, the numbers right aligned in columns
+        name_width = max(row[0].get_width() for row in rendered) + 16
+        column_width = 64
+        line_height = font.get_linesize()
+        rect = pygame.Rect(
+            0, 0, name_width + 3 * column_width + 16, line_height * len(rows) + 16
+        )
+        if self.overlay_rect is not None:
+            rect.union_ip(self.overlay_rect)
+        self.overlay_rect = rect
+
+        screen.fill((0, 0, 0), rect)
+        for i, row in enumerate(rendered):
+            y = 8 + i * line_height
+            screen.blit(row[0], (8, y))
+            for column, cell in enumerate(row[1:], start=1):
+                right = 8 + name_width + column * column_width
+                screen.blit(cell, (right - cell.get_width(), y))
+        return rect
+
+    def handle_command(self, argument: str = "") -> None:
+        """
+        Run a timing command received from the server.
+
+        Supported commands:
+            dump (default), on, off, reset, overlay on, overlay off
+
+        Args:
+            argument (str): The command without its "timing" prefix.
+        """
+        action = argument.strip() or "dump"
+        if action == "dump":
+            print(f"Frame timing: {json.dumps(self.summary())}")
+        elif action in ("on", "off"):
+            self.enabled = action == "on"
+        elif action == "reset":
+            self.reset()
+        elif action in ("overlay on", "overlay off"):
+            self.overlay = action == "overlay on"
+            self.overlay_rect = None
+            if self.overlay:
+                self.enabled = True
+        else:
+            print(f"Unknown timing command: {argument}")
+
+
+# Shared by the render loop and every interface
+frame_timer = FrameTimer()
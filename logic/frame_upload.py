@@ -0,0 +1,57 @@
+import numpy as np
+import pygame
+
+# Channel masks laying a 24-bit surface out as R, G, B bytes in memory, the
+# same layout as the frames decoded by moviepy
+RGB_MASKS = (
+    (0x0000FF, 0x00FF00, 0xFF0000, 0)
+    if pygame.get_sdl_byteorder() == pygame.LIL_ENDIAN
+    else (0xFF0000, 0x00FF00, 0x0000FF, 0)
+)
+
+
+class FrameUploader:
+    """Class to copy decoded video frames into persistent surfaces.
+
+    One surface is kept per frame resolution and every frame is written into
+    its pixel memory in place, so playback allocates no surface and no
+    intermediate bytes per frame.
+    """
+
+    def __init__(self) -> None:
+        self.surfaces: dict[tuple[int, int], pygame.Surface] = {}
+
+    def surface_for(self, size: tuple[int, int]) -> pygame.Surface:
+        """Return the persistent surface of a resolution, creating it once."""
+        surface = self.surfaces.get(size)
+        if surface is None:
+            surface = pygame.Surface(size, 0, 24, RGB_MASKS)
+            self.surfaces[size] = surface
+        return surface
+
+    def upload(self, frame: np.ndarray) -> pygame.Surface:
+        """
+        Write a video frame into the surface of its resolution.
+
+        Args:
+            frame (ndarray): The frame as a (height, width, 3) uint8 array.
+
+        Returns:
+            Surface: The persistent surface now holding the frame. It is
+            overwritten by the next frame of the same resolution.
+        """
+        height, width = frame.shape[:2]
+        surface = self.surface_for((width, height))
+        if surface.get_pitch() == width * 3 and frame.flags.c_contiguous:
+            # Rows are packed in both, a single copy into the pixel memory.
+            # The proxy locks the surface, drop it before the surface is blitted
+            pixels = surface.get_buffer()
+            np.frombuffer(pixels, dtype=np.uint8)[:] = frame.reshape(-1)
+            del pixels
+        else:
+            pygame.surfarray.blit_array(surface, frame.swapaxes(0, 1))
+        return surface
+
+    def clear(self) -> None:
+        """Release the persistent surfaces."""
+        self.surfaces.clear()
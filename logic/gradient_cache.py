@@ -0,0 +1,104 @@
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from assets.config import GRADIENT_CACHE_MAX_BYTES
+
+
+class GradientCache:
+    """Class to build vertical gradient surfaces and keep them in an LRU cache."""
+
+    def __init__(self, max_bytes: int = GRADIENT_CACHE_MAX_BYTES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes (int): Maximum pixel memory kept alive by the cache.
+        """
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.surfaces: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def build(
+        color_top: tuple[int, int, int],
+        color_bottom: tuple[int, int, int],
+        size: tuple[int, int],
+    ) -> pygame.Surface:
+        """Build a gradient surface in a single NumPy pass.
+
+        Args:
+            color_top (tuple[int, int, int]): Color of the first row.
+            color_bottom (tuple[int, int, int]): Color the last row tends to.
+            size (tuple[int, int]): Width and height of the surface.
+
+        Returns:
+            Surface: A new surface filled with the gradient.
+        """
+        width, height = size
+        top = np.array(color_top, dtype=np.float32)
+        bottom = np.array(color_bottom, dtype=np.float32)
+        steps = np.arange(height, dtype=np.float32)[:, None] / max(height, 1)
+        column = (top + (bottom - top) * steps).astype(np.uint8)
+
+        surface = pygame.Surface(size)
+        pixels = np.broadcast_to(column[None, :, :], (width, height, 3))
+        pygame.surfarray.blit_array(surface, pixels)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def get(
+        self,
+        color_top: tuple[int, int, int],
+        color_bottom: tuple[int, int, int],
+        size: tuple[int, int],
+    ) -> pygame.Surface:
+        """Get a cached gradient surface, building it on a miss.
+
+        The returned surface is shared, so callers must only blit it and
+        never draw on it.
+
+        Args:
+            color_top (tuple[int, int, int]): Color of the first row.
+            color_bottom (tuple[int, int, int]): Color the last row tends to.
+            size (tuple[int, int]): Width and height of the surface.
+
+        Returns:
+            Surface: The gradient surface.
+        """
+        key = (tuple(color_top), tuple(color_bottom), tuple(size))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = self.build(color_top, color_bottom, size)
+        self.surfaces[key] = surface
+        self.used_bytes += self.surface_bytes(surface)
+        self.evict()
+        return surface
+
+    def evict(self) -> None:
+        """Drop least recently used surfaces until the cache fits its cap.
+
+        The most recent surface is always kept, even if it alone is larger
+        than the cap.
+        """
+        while self.used_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, surface = self.surfaces.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(surface)
+
+    def clear(self) -> None:
+        """Remove every cached surface."""
+        self.surfaces.clear()
+        self.used_bytes = 0
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """Return the pixel memory used by a surface."""
+        return surface.get_pitch() * surface.get_height()
+
+
+# Shared by every interface so the same gradient is only built once
+gradient_cache = GradientCache()
@@ -1,6 +1,7 @@
 import pygame
 from interfaces.advertising import Advertising
 from interfaces.slot_machine import SlotMachine
+from logic.frame_timer import frame_timer
 
 class InterfaceManager:
     """Class to manage and switch between different interfaces."""
@@ -8,20 +9,34 @@ class InterfaceManager:
     def __init__(self, screen):
         """Initialize the InterfaceManager with the given screen."""
         self.screen = screen  # Use the existing screen
-        self.clock = pygame.time.Clock()
         
         # Initialize interfaces
         self.advertising_interface = None
         self.slot_machine_interface = None
+        self.overlay_shown = False
         self.initialize_interfaces()
 
     def initialize_interfaces(self):
-        """Initialize or reinitialize the interfaces."""
+        """Initialize the interfaces, both stay loaded for the whole session."""
         if self.advertising_interface is None:
             self.advertising_interface = Advertising()
         if self.slot_machine_interface is None:
             self.slot_machine_interface = SlotMachine()
+        self.slot_machine_interface.suspend()
         self.current_interface = self.advertising_interface
+        self.current_interface.resume()
+
+    def switch_to(self, interface):
+        """Suspend the current interface and resume another one.
+
+        Args:
+            interface: The interface to show.
+        """
+        if interface is self.current_interface:
+            return
+        self.current_interface.suspend()
+        self.current_interface = interface
+        interface.resume()
 
     def handle_command(self, command):
         """Handle command and switch interfaces accordingly.
@@ -31,28 +46,72 @@ class InterfaceManager:
         """
         if command == "1":
             if self.current_interface == self.slot_machine_interface:
-                self.slot_machine_interface.stop()
-                self.slot_machine_interface = None
-                pygame.time.wait(200)  # Wait for resources to be released
-                self.advertising_interface = Advertising()
-                self.current_interface = self.advertising_interface
+                self.switch_to(self.advertising_interface)
                 print("Switching to Advertising")
         elif command == "2":
             if self.current_interface == self.advertising_interface:
-                self.advertising_interface.stop()
-                self.advertising_interface = None
-                pygame.time.wait(200)  # Wait for resources to be released
-                self.slot_machine_interface = SlotMachine()
-                self.current_interface = self.slot_machine_interface
+                self.switch_to(self.slot_machine_interface)
                 print("Switching to Slot Machine")
 
+    def switch_to_advertising(self):
+        """Switch to the advertising interface."""
+        self.handle_command("1")
+
+    def switch_to_slot_machine(self):
+        """Switch to the slot machine interface."""
+        self.handle_command("2")
+
+    def handle_event(self, event):
+        """Forward an input event to the current interface.
+
+        Args:
+            event (pygame.event.Event): The event to forward.
+        """
+        handler = getattr(self.current_interface, "handle_event", None)
+        if handler:
+            handler(event)
+
+    def is_animating(self):
+        """Check if the current interface changes without any event.
+
+        Returns:
+            bool: True while frames have to be drawn at the frame rate cap.
+        """
+        check = getattr(self.current_interface, "is_animating", None)
+        return check() if check else True
+
+    def max_fps(self):
+        """Get the frame rate cap of the current interface.
+
+        Returns:
+            int: The cap in frames per second, 0 for no cap.
+        """
+        return getattr(self.current_interface, "max_fps", 0)
+
     def run(self):
-        """Run the current interface."""
+        """Draw one frame of the current interface, paced by the caller."""
         if self.current_interface:
-            self.screen.fill((0, 0, 0))
-            self.current_interface.run(self.screen)
-            pygame.display.flip()
-            self.clock.tick(60)
+            # Interfaces with a compositor present their own dirty rects
+            if hasattr(self.current_interface, "compositor"):
+                with frame_timer.stage("manager.interface_run"):
+                    self.current_interface.run(self.screen)
+            else:
+                self.screen.fill((0, 0, 0))
+                with frame_timer.stage("manager.interface_run"):
+                    self.current_interface.run(self.screen)
+                with frame_timer.stage("manager.flip"):
+                    pygame.display.flip()
+            self.draw_timing_overlay()
+
+    def draw_timing_overlay(self):
+        """Draw the frame timing overlay, or repaint the screen once it is hidden."""
+        if frame_timer.overlay:
+            pygame.display.update(frame_timer.draw_overlay(self.screen))
+            self.overlay_shown = True
+        elif self.overlay_shown:
+            self.overlay_shown = False
+            if hasattr(self.current_interface, "compositor"):
+                self.current_interface.compositor.invalidate()
 
     def stop(self):
         """Stop all interfaces and clean up."""
@@ -0,0 +1,258 @@
+"""Offline ingest of the advertising videos.
+
+Bakes every clip of ADVERTISING_VIDEO_PATH once into a content-hashed cache
+directory: its frames decoded to a raw frame store at the playback
+resolution, and its audio decoded to WAV. Only new or changed files are
+processed on later runs.
+
+Run from the repository root:
+
+    python -m logic.media_ingest [--prune]
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+from assets.config import (
+    ADVERTISING_CACHE_PATH,
+    ADVERTISING_VIDEO_PATH,
+    ADVERTISING_VIDEO_SIZE,
+)
+from logic.frame_store import write_frame_store
+
+VIDEO_EXTENSIONS = (".mp4",)
+INDEX_FILE = "index.json"
+META_FILE = "meta.json"
+FRAMES_FILE = "frames.bin"
+AUDIO_FILE = "audio.wav"
+
+
+class MediaCache:
+    """Class to pre-bake advertising clips into a content-hashed cache."""
+
+    def __init__(
+        self,
+        video_path: str = ADVERTISING_VIDEO_PATH,
+        cache_path: str = ADVERTISING_CACHE_PATH,
+        target_resolution: tuple[int, int] = ADVERTISING_VIDEO_SIZE,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            video_path (str): Directory with the source clips.
+            cache_path (str): Directory where baked clips are stored.
+            target_resolution (tuple[int, int]): Playback size of the frames.
+        """
+        self.video_path = video_path
+        self.cache_path = cache_path
+        self.target_resolution = tuple(target_resolution)
+        self.index = self.load_index()
+        self.failed: list[str] = []  # Clips that could not be baked by the last ingest
+
+    def load_index(self) -> dict:
+        """Load the source file index, or an empty one if there is none."""
+        try:
+            with open(os.path.join(self.cache_path, INDEX_FILE)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def save_index(self) -> None:
+        """Write the source file index atomically."""
+        os.makedirs(self.cache_path, exist_ok=True)
+        path = os.path.join(self.cache_path, INDEX_FILE)
+        with open(path + ".tmp", "w") as file:
+            json.dump(self.index, file, indent=2)
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """Return the SHA-256 of a file's content."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def entry_path(self, content_hash: str) -> str:
+        """Return the cache directory of a content hash."""
+        return os.path.join(self.cache_path, content_hash[:16])
+
+    def is_baked(self, entry: str) -> bool:
+        """Check that an entry was fully written for the current resolution."""
+        try:
+            with open(os.path.join(entry, META_FILE)) as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return False
+        return tuple(meta.get("size", ())) == self.target_resolution and os.path.exists(
+            os.path.join(entry, FRAMES_FILE)
+        )
+
+    def sources(self) -> list[str]:
+        """List the source clips, sorted by name."""
+        if not os.path.isdir(self.video_path):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(self.video_path)
+            if name.lower().endswith(VIDEO_EXTENSIONS)
+        )
+
+    def ingest(self) -> list[str]:
+        """Bake every new or changed source clip.
+
+        A clip that cannot be baked is logged and skipped, the others are
+        still baked and indexed. Its name is kept in self.failed.
+
+        Returns:
+            list[str]: The names of the clips that were baked.
+        """
+        baked = []
+        self.failed = []
+        names = self.sources()
+        for name in names:
+            try:
+                if self.ingest_file(name):
+                    baked.append(name)
+            except Exception as e:
+                print(f"Error baking {name}: {e}")
+                self.failed.append(name)
+
+        # Forget clips that were removed from the source directory
+        for name in set(self.index) - set(names):
+            del self.index[name]
+        self.save_index()
+        return baked
+
+    def ingest_file(self, name: str) -> bool:
+        """Bake one source clip unless the cache already holds it.
+
+        Args:
+            name (str): File name of the clip inside the source directory.
+
+        Returns:
+            bool: True if the clip was baked, False if it was up to date.
+        """
+        source = os.path.join(self.video_path, name)
+        stat = os.stat(source)
+        known = self.index.get(name)
+        if (
+            known
+            and known["size"] == stat.st_size
+            and known["mtime"] == stat.st_mtime
+            and self.is_baked(self.entry_path(known["hash"]))
+        ):
+            return False
+
+        content_hash = self.file_hash(source)
+        entry = self.entry_path(content_hash)
+        changed = not self.is_baked(entry)
+        if changed:
+            print(f"Baking {name}")
+            self.bake(source, entry)
+        self.index[name] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": content_hash,
+        }
+        return changed
+
+    def bake(self, source: str, entry: str) -> None:
+        """Decode a clip's frames and audio into a cache entry.
+
+        The entry is written to a temporary directory and renamed into place,
+        so an interrupted ingest never leaves a half-written entry.
+
+        Args:
+            source (str): Path of the source clip.
+            entry (str): Cache directory of the clip.
+        """
+        # Imported here, playback reads the cache index without loading ffmpeg
+        import moviepy.editor as mp
+
+        staging = entry + ".tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        clip = mp.VideoFileClip(source)
+        try:
+            resized = clip.resize(newsize=self.target_resolution)
+            frames = write_frame_store(
+                os.path.join(staging, FRAMES_FILE),
+                resized.iter_frames(fps=clip.fps, dtype="uint8"),
+                self.target_resolution,
+                clip.fps,
+            )
+            has_audio = clip.audio is not None
+            if has_audio:
+                clip.audio.write_audiofile(
+                    os.path.join(staging, AUDIO_FILE),
+                    fps=44100,
+                    codec="pcm_s16le",
+                    logger=None,
+                )
+            meta = {
+                "source": os.path.basename(source),
+                "size": list(self.target_resolution),
+                "fps": clip.fps,
+                "frames": frames,
+                "duration": clip.duration,
+                "audio": has_audio,
+            }
+        finally:
+            clip.close()
+
+        with open(os.path.join(staging, META_FILE), "w") as file:
+            json.dump(meta, file, indent=2)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(staging, entry)
+
+    def entries(self) -> list[str]:
+        """List the baked entries of the current source clips, in playlist order.
+
+        Returns:
+            list[str]: Cache directories ready for playback.
+        """
+        entries = []
+        for name in sorted(self.index):
+            entry = self.entry_path(self.index[name]["hash"])
+            if self.is_baked(entry):
+                entries.append(entry)
+        return entries
+
+    def prune(self) -> list[str]:
+        """Delete cache entries no source clip refers to anymore.
+
+        Returns:
+            list[str]: The deleted cache directories.
+        """
+        used = {self.entry_path(known["hash"]) for known in self.index.values()}
+        removed = []
+        for name in os.listdir(self.cache_path):
+            entry = os.path.join(self.cache_path, name)
+            if os.path.isdir(entry) and entry not in used:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed.append(entry)
+        return removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bake the advertising videos.")
+    parser.add_argument(
+        "--prune", action="store_true", help="delete cache entries no longer used"
+    )
+    args = parser.parse_args()
+
+    cache = MediaCache()
+    baked = cache.ingest()
+    print(f"Baked {len(baked)} clip(s), {len(cache.entries())} ready for playback")
+    if args.prune:
+        for entry in cache.prune():
+            print(f"Removed {entry}")
+
+
+if __name__ == "__main__":
+    main()
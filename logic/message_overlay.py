@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+
+import pygame
+
+from logic.asset_manager import asset_manager
+
+
+@dataclass(frozen=True)
+class MessageStyle:
+    """Look of a framed message: font, spacing and colors."""
+
+    font_path: str
+    font_size: int
+    padding: int
+    border_thickness: int
+    border_radius: int
+    font_color: tuple[int, int, int]
+    outside_border_color: tuple[int, int, int]
+    background_color: tuple[int, int, int]
+    inside_border_color: tuple[int, int, int]
+
+
+class MessageOverlayCache:
+    """Class to pre-render framed messages once and reuse them as single blits."""
+
+    def __init__(self) -> None:
+        self.overlays: dict = {}
+
+    @staticmethod
+    def build(message: str, style: MessageStyle) -> pygame.Surface:
+        """
+        Render a message with its rounded background and borders.
+
+        Args:
+            message (str): The text to show.
+            style (MessageStyle): The look of the message.
+
+        Returns:
+            Surface: The message, transparent outside its rounded frame.
+        """
+        font = asset_manager.font(style.font_path, style.font_size)
+        text = font.render(message, True, style.font_color)
+
+        offset = style.padding + style.border_thickness
+        width = text.get_width() + 2 * offset
+        height = text.get_height() + 2 * offset
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        rect = pygame.Rect(
+            style.border_thickness,
+            style.border_thickness,
+            width - 2 * style.border_thickness,
+            height - 2 * style.border_thickness,
+        )
+        pygame.draw.rect(
+            surface,
+            style.outside_border_color,
+            surface.get_rect(),
+            0,
+            style.border_radius + 5,
+        )
+        pygame.draw.rect(surface, style.background_color, rect, 0, style.border_radius)
+        pygame.draw.rect(
+            surface,
+            style.inside_border_color,
+            rect,
+            style.border_thickness,
+            style.border_radius,
+        )
+        surface.blit(text, (offset, offset))
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def get(
+        self, message: str, style: MessageStyle, resolution: tuple[int, int]
+    ) -> tuple:
+        """
+        Get a message centered on the screen, rendering it on first use.
+
+        Args:
+            message (str): The text to show.
+            style (MessageStyle): The look of the message.
+            resolution (tuple[int, int]): Size of the screen it is centered on.
+
+        Returns:
+            tuple: The overlay surface and the screen rect to blit it at.
+        """
+        key = (message, style, tuple(resolution))
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            surface = self.build(message, style)
+            width, height = resolution
+            rect = surface.get_rect(center=(width // 2, height // 2))
+            overlay = self.overlays[key] = (surface, rect)
+        return overlay
+
+    def clear(self) -> None:
+        """Drop every rendered message."""
+        self.overlays.clear()
+
+
+# Shared so each message is rendered once per session
+message_overlays = MessageOverlayCache()
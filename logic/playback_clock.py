@@ -0,0 +1,79 @@
+import time
+
+import pygame
+
+from assets.config import AV_SYNC_TOLERANCE_MS
+
+
+class PlaybackClock:
+    """Class to keep the playback position of the current advertising clip.
+
+    While the clip's audio plays, the mixer position is the master clock and
+    the wall clock only smooths between its coarse updates. Clips without
+    audio, or the tail of a clip whose audio already ended, run on the wall
+    clock alone. The clock also counts how well the video keeps up with it.
+    """
+
+    def __init__(self, tolerance_ms: int = AV_SYNC_TOLERANCE_MS) -> None:
+        """Initialize the clock.
+
+        Args:
+            tolerance_ms (int): Drift tolerated before realigning to the audio.
+        """
+        self.tolerance = tolerance_ms / 1000
+        self.anchor = time.perf_counter()
+        self.paused_at = None
+        self.audio = False
+        self.drift = 0.0  # Clock position minus timestamp of the shown frame (s)
+        self.max_drift = 0.0
+        self.dropped_frames = 0
+        self.repeated_frames = 0
+
+    def start(self, audio: bool) -> None:
+        """Restart the clock at the beginning of a clip.
+
+        Args:
+            audio (bool): Whether the clip's audio was started on the mixer.
+        """
+        self.anchor = self.paused_at or time.perf_counter()
+        self.audio = audio
+
+    def pause(self) -> None:
+        """Freeze the position, while the interface is suspended."""
+        if self.paused_at is None:
+            self.paused_at = time.perf_counter()
+
+    def resume(self) -> None:
+        """Continue from the position the clock was paused at."""
+        if self.paused_at is not None:
+            self.anchor += time.perf_counter() - self.paused_at
+            self.paused_at = None
+
+    def position(self) -> float:
+        """Return the playback position of the current clip in seconds."""
+        position = (self.paused_at or time.perf_counter()) - self.anchor
+        if self.audio and pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+            audio_position = pygame.mixer.music.get_pos() / 1000
+            if audio_position >= 0 and abs(audio_position - position) > self.tolerance:
+                self.anchor = time.perf_counter() - audio_position
+                position = audio_position
+        return position
+
+    def record(self, timestamp: float, position: float) -> None:
+        """Record the drift of the frame shown at a clock position."""
+        self.drift = position - timestamp
+        self.max_drift = max(self.max_drift, abs(self.drift))
+
+    def stats(self) -> dict:
+        """Return the synchronization counters.
+
+        Returns:
+            dict: Current and maximum drift in milliseconds, and the number of
+            frames dropped and repeated to stay in sync.
+        """
+        return {
+            "drift_ms": round(self.drift * 1000, 1),
+            "max_drift_ms": round(self.max_drift * 1000, 1),
+            "dropped_frames": self.dropped_frames,
+            "repeated_frames": self.repeated_frames,
+        }
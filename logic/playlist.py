@@ -0,0 +1,359 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, time
+from time import monotonic
+
+from assets.config import (
+    ADVERTISING_INGEST_RETRY_MAX_S,
+    ADVERTISING_PLAYLIST_FILE,
+    ADVERTISING_WATCH_INTERVAL_S,
+)
+from logic.media_ingest import VIDEO_EXTENSIONS, MediaCache
+
+# Settings of the clips live in a sidecar next to the videos, by file name.
+# Clips without settings play with weight 1 all day:
+#   {"promo.mp4": {"weight": 3, "start": "08:00", "end": "13:30"},
+#    "night.mp4": {"start": "22:00", "end": "06:00", "enabled": true}}
+
+
+def parse_time(value: str) -> time:
+    """Parse a "HH:MM" time of a scheduling window, None if it is not set."""
+    return time.fromisoformat(value) if value else None
+
+
+def validate_settings(settings: dict) -> None:
+    """
+    Check the settings of a clip read from the sidecar.
+
+    Args:
+        settings (dict): The weight, start, end and enabled values of a clip.
+
+    Raises:
+        ValueError: If a value has the wrong type or format.
+    """
+    if not isinstance(settings, dict):
+        raise ValueError("settings must be an object")
+    weight = settings.get("weight", 1)
+    if isinstance(weight, bool) or not isinstance(weight, int):
+        raise ValueError(f"weight must be an integer, not {weight!r}")
+    for key in ("start", "end"):
+        value = settings.get(key)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{key} must be a \"HH:MM\" time, not {value!r}")
+        parse_time(value)
+    if not isinstance(settings.get("enabled", True), bool):
+        raise ValueError(f"enabled must be true or false, not {settings['enabled']!r}")
+
+
+@dataclass
+class PlaylistItem:
+    """A baked clip of the playlist with its rotation settings."""
+
+    name: str
+    entry: str
+    weight: int = 1
+    start: str = None  # Scheduling window, "HH:MM" local time
+    end: str = None
+    enabled: bool = True
+    current_weight: int = 0  # Running score of the weighted rotation
+
+    def is_scheduled(self, now: datetime) -> bool:
+        """Check that the clip is enabled and inside its window at a given time."""
+        if not self.enabled or self.weight <= 0:
+            return False
+        start, end = parse_time(self.start), parse_time(self.end)
+        if start is None or end is None:
+            return True
+        moment = now.time()
+        if start <= end:
+            return start <= moment < end
+        return moment >= start or moment < end  # Window across midnight
+
+    def settings(self) -> dict:
+        """Return the settings saved in the sidecar."""
+        return {
+            "weight": self.weight,
+            "start": self.start,
+            "end": self.end,
+            "enabled": self.enabled,
+        }
+
+
+class Playlist:
+    """Class to rotate the advertising clips by weight within their windows.
+
+    The rotation is a smooth weighted round-robin: a clip of weight 3 plays
+    three times as often as a clip of weight 1, interleaved rather than in a
+    burst. A background watcher ingests clips added to the video directory
+    and adds them to the rotation without interrupting playback.
+    """
+
+    def __init__(
+        self,
+        cache: MediaCache = None,
+        interval: float = ADVERTISING_WATCH_INTERVAL_S,
+    ) -> None:
+        """Load the playlist and start watching the video directory.
+
+        Args:
+            cache (MediaCache): The cache of baked clips.
+            interval (float): Seconds between two scans of the video directory.
+        """
+        self.cache = cache or MediaCache()
+        self.settings_path = os.path.join(self.cache.video_path, ADVERTISING_PLAYLIST_FILE)
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.items: dict[str, PlaylistItem] = {}
+        self.settings = self.load_settings()
+        self.refresh()
+
+        self.running = True
+        self.wakeup = threading.Event()
+        self.watcher = threading.Thread(target=self.watch_loop, daemon=True)
+        self.watcher.start()
+
+    def load_settings(self) -> dict:
+        """Load the clip settings from the sidecar, or none if it is missing."""
+        try:
+            with open(self.settings_path) as file:
+                settings = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Error reading playlist settings: {e}")
+            return {}
+        return settings if isinstance(settings, dict) else {}
+
+    def save_settings(self) -> None:
+        """Write the clip settings to the sidecar atomically."""
+        with self.lock:
+            self.settings.update(
+                {name: item.settings() for name, item in self.items.items()}
+            )
+            settings = dict(self.settings)
+        try:
+            with open(self.settings_path + ".tmp", "w") as file:
+                json.dump(settings, file, indent=2)
+            os.replace(self.settings_path + ".tmp", self.settings_path)
+        except OSError as e:
+            print(f"Error saving playlist settings: {e}")
+
+    def refresh(self) -> None:
+        """Rebuild the items from the baked clips, keeping their rotation state."""
+        baked = {}
+        for name, known in self.cache.index.items():
+            entry = self.cache.entry_path(known["hash"])
+            if self.cache.is_baked(entry):
+                baked[name] = entry
+
+        with self.lock:
+            items = {}
+            for name in sorted(baked):
+                settings = self.settings.get(name, {})
+                try:
+                    validate_settings(settings)
+                except ValueError as e:
+                    # The clip keeps playing with its current settings
+                    print(f"Error in playlist settings of {name}: {e}")
+                    settings = {}
+                item = self.items.get(name) or PlaylistItem(name, baked[name])
+                item.entry = baked[name]
+                item.weight = settings.get("weight", item.weight)
+                item.start = settings.get("start", item.start)
+                item.end = settings.get("end", item.end)
+                item.enabled = settings.get("enabled", item.enabled)
+                items[name] = item
+            self.items = items
+
+    def next_entry(self, now: datetime = None) -> str:
+        """
+        Pick the next clip to play.
+
+        Args:
+            now (datetime): Time used for the scheduling windows, now by default.
+
+        Returns:
+            str: Cache entry of the clip, or None if no clip is scheduled.
+        """
+        now = now or datetime.now()
+        with self.lock:
+            scheduled = [item for item in self.items.values() if item.is_scheduled(now)]
+            if not scheduled:
+                return None
+            total = 0
+            for item in scheduled:
+                item.current_weight += item.weight
+                total += item.weight
+            chosen = max(scheduled, key=lambda item: item.current_weight)
+            chosen.current_weight -= total
+            return chosen.entry
+
+    def update(self, name: str, **settings) -> bool:
+        """
+        Change the settings of a clip and save them.
+
+        Args:
+            name (str): File name of the clip.
+            **settings: weight, start, end or enabled values to set.
+
+        Returns:
+            bool: False if the clip is not in the playlist.
+        """
+        with self.lock:
+            item = self.items.get(name)
+            if item is None:
+                return False
+            for key, value in settings.items():
+                setattr(item, key, value)
+            item.current_weight = 0
+        self.save_settings()
+        return True
+
+    def describe(self) -> list[dict]:
+        """Return the name, settings and window state of every clip."""
+        now = datetime.now()
+        with self.lock:
+            return [
+                {"name": name, **item.settings(), "scheduled": item.is_scheduled(now)}
+                for name, item in self.items.items()
+            ]
+
+    def handle_command(self, argument: str = "") -> None:
+        """
+        Run a playlist command received from the server.
+
+        Supported commands:
+            status
+            reload
+            weight <clip> <weight>
+            enable <clip> / disable <clip>
+            window <clip> <HH:MM> <HH:MM> / window <clip> all
+
+        Args:
+            argument (str): The command without its "playlist" prefix.
+        """
+        action, *args = argument.split() or ["status"]
+        try:
+            if action == "status":
+                for item in self.describe():
+                    print(f"Playlist: {item}")
+            elif action == "reload":
+                self.wakeup.set()
+            elif action == "weight" and len(args) == 2:
+                self.report(args[0], self.update(args[0], weight=int(args[1])))
+            elif action in ("enable", "disable") and len(args) == 1:
+                self.report(args[0], self.update(args[0], enabled=action == "enable"))
+            elif action == "window" and len(args) == 2 and args[1] == "all":
+                self.report(args[0], self.update(args[0], start=None, end=None))
+            elif action == "window" and len(args) == 3:
+                parse_time(args[1]), parse_time(args[2])  # Validate before saving
+                self.report(args[0], self.update(args[0], start=args[1], end=args[2]))
+            else:
+                print(f"Unknown playlist command: {argument}")
+        except ValueError as e:
+            print(f"Error in playlist command: {e}")
+
+    @staticmethod
+    def report(name: str, updated: bool) -> None:
+        """Print the outcome of a playlist change."""
+        print(f"Playlist updated: {name}" if updated else f"Clip not in playlist: {name}")
+
+    def scan(self) -> dict:
+        """Return the size and modification time of every source clip."""
+        sources = {}
+        try:
+            with os.scandir(self.cache.video_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(VIDEO_EXTENSIONS):
+                        stat = entry.stat()
+                        sources[entry.name] = (stat.st_size, stat.st_mtime)
+        except OSError:
+            pass
+        return sources
+
+    def watch_loop(self) -> None:
+        """Ingest new or changed clips and sidecar edits as they appear.
+
+        An ingest that fails for some clips is retried with a growing delay,
+        up to ADVERTISING_INGEST_RETRY_MAX_S, even if nothing else changes.
+        """
+        last_scan = {}  # Unbaked clips found at startup are ingested too
+        settings_mtime = self.settings_mtime()
+        failures = 0
+        retry_at = 0.0
+        while self.running:
+            reload = self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+            if not self.running:
+                break
+
+            # A file still being copied changes between two scans, it is
+            # only ingested once its size and mtime are stable
+            current = self.scan()
+            retry = failures > 0 and monotonic() >= retry_at
+            if reload or retry or (current != last_scan and self.is_stable(current)):
+                try:
+                    baked = self.cache.ingest()
+                    failed = bool(self.cache.failed)
+                except Exception as e:
+                    print(f"Error ingesting videos: {e}")
+                    baked, failed = [], True
+                if baked:
+                    print(f"New clips in the playlist: {', '.join(baked)}")
+                # Clips baked before a failure join the rotation too
+                self.refresh()
+                last_scan = current
+
+                if failed:
+                    failures += 1
+                    delay = min(
+                        self.interval * 2**failures, ADVERTISING_INGEST_RETRY_MAX_S
+                    )
+                    retry_at = monotonic() + delay
+                else:
+                    failures = 0
+
+            mtime = self.settings_mtime()
+            if mtime != settings_mtime:
+                settings_mtime = mtime
+                with self.lock:
+                    self.settings = self.load_settings()
+                self.refresh()
+
+    def is_stable(self, current: dict) -> bool:
+        """Check that the source clips did not change since the given scan."""
+        if self.wakeup.wait(1):
+            return False
+        return self.scan() == current
+
+    def settings_mtime(self) -> float:
+        """Return the modification time of the sidecar, None if it is missing."""
+        try:
+            return os.stat(self.settings_path).st_mtime
+        except OSError:
+            return None
+
+    def stop(self) -> None:
+        """Stop watching the video directory."""
+        self.running = False
+        self.wakeup.set()
+        self.watcher.join(timeout=5)
+
+
+playlist = None
+playlist_lock = threading.Lock()
+
+
+def get_playlist() -> Playlist:
+    """Get the process-wide playlist, loading it on first use.
+
+    Returns:
+        Playlist: The shared playlist.
+    """
+    global playlist
+    with playlist_lock:
+        if playlist is None:
+            playlist = Playlist()
+        return playlist
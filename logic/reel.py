@@ -0,0 +1,63 @@
+import math
+from dataclasses import dataclass
+
+
+@dataclass
+class Reel:
+    """Position of a slot machine reel, in symbols scrolled since the spin started.
+
+    The whole part counts the symbols that went by, the fraction is how far
+    the next symbol has scrolled into view. The position only moves through
+    advance(), by the elapsed time, so the reel turns at the same speed at
+    any frame rate.
+    """
+
+    position: float = 0.0
+    target: float = None  # Position the reel stops at, None while spinning freely
+    stop_at: int = None  # Tick after which a free spin settles on the next symbol
+
+    def spin_until(self, stop_at: int) -> None:
+        """
+        Spin freely from the current symbol until a given tick.
+
+        Args:
+            stop_at (int): Tick in ms, from pygame.time.get_ticks().
+        """
+        self.position = 0.0
+        self.target = None
+        self.stop_at = stop_at
+
+    def move_by(self, symbols: int) -> None:
+        """
+        Scroll a given number of symbols further and stop.
+
+        Args:
+            symbols (int): Symbols to scroll by, 0 to stay in place.
+        """
+        self.target = math.floor(self.position) + symbols
+        self.stop_at = None
+
+    def advance(self, now: int, steps: float) -> None:
+        """
+        Move the reel by the symbols scrolled since the previous frame.
+
+        Args:
+            now (int): Current tick in ms.
+            steps (float): Symbols scrolled since the previous frame.
+        """
+        if self.target is None and self.stop_at is not None and now >= self.stop_at:
+            # Finish the symbol scrolling in so the reel stops aligned
+            self.target = math.ceil(self.position)
+        self.position += steps
+        if self.target is not None:
+            self.position = min(self.position, self.target)
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the reel reached its target."""
+        return self.target is not None and self.position >= self.target
+
+    @property
+    def offset(self) -> float:
+        """How far the next symbol has scrolled in, from 0 to 1."""
+        return self.position - math.floor(self.position)
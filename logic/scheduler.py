@@ -0,0 +1,48 @@
+import pygame
+
+from assets.config import IDLE_WAKEUP_MS
+from logic.frame_timer import frame_timer
+
+
+class FrameScheduler:
+    """Class to pace the main loop by what is on screen.
+
+    While something moves, a reel or a video, frames are paced to the frame
+    rate cap of the interface. Otherwise the loop blocks in
+    pygame.event.wait() until an input event, a server command or a timer
+    wakes it, so an idle kiosk uses next to no CPU. The idle wait still
+    returns every IDLE_WAKEUP_MS for the checks that are not event driven.
+    """
+
+    def __init__(self, idle_wakeup_ms: int = IDLE_WAKEUP_MS) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            idle_wakeup_ms (int): Longest time an idle wait blocks.
+        """
+        self.clock = pygame.time.Clock()
+        self.idle_wakeup_ms = idle_wakeup_ms
+
+    def wait(self, animating: bool, max_fps: int) -> list[pygame.event.Event]:
+        """
+        Wait until the next frame is due and collect the events received.
+
+        Args:
+            animating (bool): Whether the screen changes without any event.
+            max_fps (int): Frame rate cap while animating, 0 for no cap.
+
+        Returns:
+            list[Event]: The pending events, empty if an idle wait timed out.
+        """
+        with frame_timer.stage("scheduler.wait"):
+            if animating:
+                self.clock.tick(max_fps)
+                return pygame.event.get()
+
+            event = pygame.event.wait(self.idle_wakeup_ms)
+            # Start the frame clock over, the first animated frame is not
+            # held back by the time spent idle
+            self.clock.tick()
+            if event.type == pygame.NOEVENT:
+                return []
+            return [event, *pygame.event.get()]
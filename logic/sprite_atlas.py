@@ -0,0 +1,66 @@
+import pygame
+
+
+class SpriteAtlas:
+    """Class to pack many small surfaces into one converted surface."""
+
+    def __init__(self, max_width: int = 2048) -> None:
+        """Initialize an empty atlas.
+
+        Args:
+            max_width (int): Maximum width of a row of packed sprites.
+        """
+        self.max_width = max_width
+        self.pending: dict = {}
+        self.rects: dict = {}
+        self.surface = None
+
+    def add(self, key, surface: pygame.Surface) -> None:
+        """Queue a surface to be packed under the given key.
+
+        Args:
+            key (hashable): The key used later to blit the sprite.
+            surface (Surface): The sprite, already at its display size.
+        """
+        self.pending[key] = surface
+
+    def build(self) -> None:
+        """Pack every queued surface into a single converted surface."""
+        # Shelf packing: tallest sprites first keeps the rows compact
+        order = sorted(
+            self.pending.items(), key=lambda item: item[1].get_height(), reverse=True
+        )
+        x = y = shelf_height = atlas_width = 0
+        for key, surface in order:
+            width, height = surface.get_size()
+            if x and x + width > self.max_width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            self.rects[key] = pygame.Rect(x, y, width, height)
+            x += width
+            shelf_height = max(shelf_height, height)
+            atlas_width = max(atlas_width, x)
+
+        self.surface = pygame.Surface(
+            (max(atlas_width, 1), max(y + shelf_height, 1)), pygame.SRCALPHA
+        )
+        for key, surface in order:
+            self.surface.blit(surface, self.rects[key])
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.pending.clear()
+
+    def size(self, key) -> tuple[int, int]:
+        """Return the size of a packed sprite."""
+        return self.rects[key].size
+
+    def blit(self, target: pygame.Surface, key, position) -> None:
+        """Blit a packed sprite onto the target surface.
+
+        Args:
+            target (Surface): The surface to draw on.
+            key (hashable): The key the sprite was added with.
+            position (tuple[int, int]): Top-left destination.
+        """
+        target.blit(self.surface, position, self.rects[key])
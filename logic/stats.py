@@ -0,0 +1,25 @@
+# Latency statistics shared by the frame timer and the benchmarks
+
+# Histogram bucket upper bounds in microseconds, doubling from 16 us to ~1 s
+BUCKETS_US = [16 * 2**i for i in range(17)]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the value below which the given fraction of sorted values fall."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+def histogram(values_us: list[float]) -> dict:
+    """Count sorted values in microseconds into the log-scale BUCKETS_US."""
+    counts = {f"<={bound}us": 0 for bound in BUCKETS_US}
+    counts["overflow"] = 0
+    bucket = 0
+    for value in values_us:
+        while bucket < len(BUCKETS_US) and value > BUCKETS_US[bucket]:
+            bucket += 1
+        key = f"<={BUCKETS_US[bucket]}us" if bucket < len(BUCKETS_US) else "overflow"
+        counts[key] += 1
+    return counts
@@ -0,0 +1,175 @@
+import mmap
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from assets.config import VIDEO_BUFFER_FRAMES
+from logic.frame_store import FrameStore
+from logic.media_ingest import AUDIO_FILE, FRAMES_FILE
+from logic.playlist import Playlist
+
+
+@dataclass
+class PreparedClip:
+    """A baked playlist entry opened and ready to be decoded."""
+
+    entry: str
+    frames: FrameStore
+    audio_path: str = None
+
+
+@dataclass
+class DecodedFrame:
+    """A frame ready to be shown by the render thread."""
+
+    image: np.ndarray
+    clip_index: int  # Number of the clip in playing order
+    timestamp: float  # Position of the frame inside its clip (s)
+    duration: float  # Time the frame stays on screen (s)
+    new_clip: bool = False
+    # Only set on the first frame of a clip, the render thread starts it
+    audio_path: str = None
+
+
+class VideoDecoder:
+    """Class to feed the playlist on a worker thread into a bounded frame buffer.
+
+    The playlist picks cache entries baked by logic.media_ingest, raw frames
+    at the playback resolution and decoded audio, so nothing is decoded here:
+    frames are views of the memory-mapped frame store, faulted in ahead of
+    the render thread. The next entry is mapped while the current one still
+    plays, so clip boundaries are gapless.
+    """
+
+    def __init__(
+        self,
+        playlist: Playlist,
+        fps: float = None,
+        buffer_size: int = VIDEO_BUFFER_FRAMES,
+    ) -> None:
+        """Initialize the decoder.
+
+        Args:
+            playlist (Playlist): The rotation that picks the next clip.
+            fps (float): Rate frames are pulled from the clips, each clip's
+                native rate by default.
+            buffer_size (int): Maximum number of decoded frames kept ready.
+        """
+        self.playlist = playlist
+        self.fps = fps
+        self.frames = queue.Queue(maxsize=buffer_size)
+        self.running = False
+        self.thread = None
+        self.preloader = None
+
+    def start(self) -> None:
+        """Start decoding from the first clip."""
+        if self.running:
+            return
+        self.running = True
+        self.preloader = ThreadPoolExecutor(max_workers=1)
+        self.thread = threading.Thread(target=self.decode_loop, daemon=True)
+        self.thread.start()
+
+    def get_frame(self) -> DecodedFrame:
+        """Take the next decoded frame without waiting.
+
+        Returns:
+            DecodedFrame: The next frame, or None if none is ready yet.
+        """
+        try:
+            return self.frames.get_nowait()
+        except queue.Empty:
+            return None
+
+    def prepare(self) -> PreparedClip:
+        """Map the frame store of the next clip of the playlist.
+
+        Returns:
+            PreparedClip: The opened clip, or None if no clip is scheduled or
+            it could not be loaded.
+        """
+        entry = self.playlist.next_entry()
+        if entry is None:
+            return None
+        try:
+            frames = FrameStore(os.path.join(entry, FRAMES_FILE))
+        except Exception as e:
+            print(f"Error loading video: {e}")
+            return None
+
+        audio_path = os.path.join(entry, AUDIO_FILE)
+        return PreparedClip(
+            entry, frames, audio_path if os.path.exists(audio_path) else None
+        )
+
+    def decode_loop(self) -> None:
+        """Decode clips one after the other while preloading the next one."""
+        index = 0
+        upcoming = self.preloader.submit(self.prepare)
+        while self.running:
+            try:
+                prepared = upcoming.result()
+            except Exception as e:
+                # A failing clip must not end the decoder thread
+                print(f"Error preparing video: {e}")
+                prepared = None
+            upcoming = self.preloader.submit(self.prepare)
+
+            if prepared is not None:
+                self.decode_clip(prepared, index)
+                prepared.frames.close()
+                index += 1
+            else:
+                # Nothing scheduled or loadable, the playlist may change later
+                time.sleep(1)
+
+        upcoming.cancel()
+        self.preloader.shutdown(wait=True)
+        if upcoming.cancelled() or upcoming.exception() is not None:
+            return
+        prepared = upcoming.result()
+        if prepared is not None:
+            prepared.frames.close()
+
+    def decode_clip(self, prepared: PreparedClip, index: int) -> None:
+        """Push every frame of a clip into the buffer, blocking while it is full."""
+        audio_path = prepared.audio_path
+        store = prepared.frames
+        fps = self.fps or store.fps
+        new_clip = True
+        try:
+            for position in range(round(store.duration * fps)):
+                timestamp = position / fps
+                image = store.frame(min(int(timestamp * store.fps), len(store) - 1))
+                # Touch the pages here so the render thread does not fault them
+                image.reshape(-1)[:: mmap.PAGESIZE].sum()
+                frame = DecodedFrame(
+                    image, index, timestamp, 1 / fps, new_clip, audio_path
+                )
+                new_clip = False
+                audio_path = None
+                while self.running:
+                    try:
+                        self.frames.put(frame, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if not self.running:
+                    return
+        except Exception as e:
+            print(f"Error during decoding: {e}")
+
+    def stop(self) -> None:
+        """Stop decoding and drop the buffered frames."""
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=5)
+            self.thread = None
+        with self.frames.mutex:
+            self.frames.queue.clear()
@@ -0,0 +1,151 @@
+import json
+
+from assets.config import SERVER_MAX_FRAME_BYTES
+
+# Wire protocol spoken by the controllers.
+#
+# Framed mode: every frame is one JSON object terminated by a newline.
+#   {"id": 1, "command": "sorteo"}
+#   {"id": 2, "commands": ["sorteo", "button"]}
+# Each frame is acked as soon as its commands are queued, without waiting
+# for them to run, so a controller can pipeline many frames:
+#   {"id": 1, "status": "queued", "count": 1}
+#   {"id": 3, "status": "error", "error": "..."}
+#
+# Legacy mode: a connection whose first byte is not "{" keeps the original
+# plain-text behaviour, each read is a command (or one per line) and is
+# answered with "Command received: <message>".
+
+
+class ProtocolError(ValueError):
+    """Raised when a controller sends a frame that cannot be understood.
+
+    Attributes:
+        request_id: The id of the rejected frame, None if it could not be read.
+    """
+
+    def __init__(self, message: str, request_id=None) -> None:
+        super().__init__(message)
+        self.request_id = request_id
+
+
+def encode_frame(message: dict) -> bytes:
+    """Encode a message as one newline-terminated frame.
+
+    Args:
+        message (dict): The message to send.
+
+    Returns:
+        bytes: The encoded frame.
+    """
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def parse_frame(frame: bytes) -> tuple:
+    """Parse a request frame.
+
+    Args:
+        frame (bytes): One frame without its newline.
+
+    Returns:
+        tuple: The request id and the list of commands it carries.
+
+    Raises:
+        ProtocolError: If the frame is not a valid request.
+    """
+    try:
+        message = json.loads(frame)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ProtocolError(f"Invalid frame: {e}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError("A frame must be a JSON object")
+
+    request_id = message.get("id")
+    if "commands" in message:
+        commands = message["commands"]
+    elif "command" in message:
+        commands = [message["command"]]
+    else:
+        raise ProtocolError("A frame needs a command or commands field", request_id)
+    if not isinstance(commands, list) or not all(
+        isinstance(command, str) for command in commands
+    ):
+        raise ProtocolError("Commands must be strings", request_id)
+    return request_id, commands
+
+
+class ClientSession:
+    """Class to turn the bytes received on one connection into commands and replies."""
+
+    def __init__(self) -> None:
+        self.framed = None  # Decided by the first byte received
+        self.buffer = bytearray()
+        self.discarding = False  # Dropping the rest of a frame that was too large
+
+    def receive(self, data: bytes) -> tuple:
+        """Consume bytes received from the client.
+
+        Args:
+            data (bytes): The bytes of one read.
+
+        Returns:
+            tuple: The list of complete commands, in order, and the bytes to
+            send back to the client.
+        """
+        if self.framed is None:
+            self.framed = data.lstrip()[:1] == b"{"
+        if not self.framed:
+            return self.receive_legacy(data)
+
+        self.buffer += data
+        commands = []
+        replies = []
+        *frames, rest = self.buffer.split(b"\n")
+        self.buffer = bytearray(rest)
+        if self.discarding and frames:
+            # The first line ends the frame that was too large
+            frames.pop(0)
+            self.discarding = False
+
+        for frame in frames:
+            if not frame.strip():
+                continue
+            if len(frame) > SERVER_MAX_FRAME_BYTES:
+                replies.append(self.frame_too_large())
+                continue
+            try:
+                request_id, frame_commands = parse_frame(frame)
+            except ProtocolError as e:
+                replies.append(
+                    encode_frame({"id": e.request_id, "status": "error", "error": str(e)})
+                )
+                continue
+            commands.extend(frame_commands)
+            replies.append(
+                encode_frame(
+                    {"id": request_id, "status": "queued", "count": len(frame_commands)}
+                )
+            )
+
+        # An unfinished frame past the limit is dropped up to its newline,
+        # its error follows the acks of the frames before it
+        if len(self.buffer) > SERVER_MAX_FRAME_BYTES or self.discarding:
+            self.buffer.clear()
+            if not self.discarding:
+                self.discarding = True
+                replies.append(self.frame_too_large())
+        return commands, b"".join(replies)
+
+    @staticmethod
+    def frame_too_large() -> bytes:
+        """Return the error reply of a frame over SERVER_MAX_FRAME_BYTES."""
+        return encode_frame({"id": None, "status": "error", "error": "Frame too large"})
+
+    def receive_legacy(self, data: bytes) -> tuple:
+        """Handle a read from a plain-text controller."""
+        message = data.decode(errors="replace")
+        if "\n" in message:
+            commands = [line.strip() for line in message.splitlines() if line.strip()]
+        else:
+            commands = [message]
+        return commands, f"Command received: {message}".encode()
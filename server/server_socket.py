@@ -1,46 +1,72 @@
+import asyncio
+import queue
 import socket
 import threading
 from data.data_base import DataBase
+from logic.events import COMMAND_RECEIVED, CONNECTION_CHANGED, post_event
+from server.protocol import ClientSession
+from assets.config import SERVER_BACKLOG, SERVER_MODE, SERVER_WRITE_BUFFER_BYTES
 
 class ServerSocket:
     """Class to handle server socket communication."""
 
-    def __init__(self, host="0.0.0.0", port=9999):
+    def __init__(self, host="0.0.0.0", port=9999, mode=SERVER_MODE):
         """Initialize the server socket.
 
         Args:
             host (str): The host IP address. Defaults to "0.0.0.0".
-            port (int): The port number. Defaults to 9999.
+            port (int): The port number, 0 picks a free one. Defaults to 9999.
+            mode (str): "asyncio" to serve every client from one event loop,
+                "thread" to start one thread per client. Defaults to SERVER_MODE.
         """
         self.host = host
         self.port = port
+        self.mode = mode
         self.server_socket = None
-        self.client_socket = None
-        self.command = None
+        self.clients = set()
+        self.clients_lock = threading.Lock()
+        self.commands = queue.SimpleQueue()
         self.running = True
         self.shared_data = DataBase()
         self.command_callbacks = {}
+        self.argument_commands = set()  # Commands whose callback takes an argument
         self.connection_established = False
+        self.ready = threading.Event()  # Set once the server is listening
+
+        # Event loop state, only used in asyncio mode
+        self.loop = None
+        self.stopped = None
 
         # Start the server in a separate thread
-        self.server_thread = threading.Thread(target=self.start_server)
+        if self.mode == "asyncio":
+            target = self.start_async_server
+        else:
+            target = self.start_server
+        self.server_thread = threading.Thread(target=target)
         self.server_thread.daemon = True
         self.server_thread.start()
 
     def start_server(self):
         """Start the server to listen for connections."""
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(5)
+        self.server_socket.listen(SERVER_BACKLOG)
+        self.port = self.server_socket.getsockname()[1]
+        self.ready.set()
         print(f"Server listening on port {self.port}")
 
         while self.running:
-            self.client_socket, addr = self.server_socket.accept()
-            self.connection_established = True
+            try:
+                client_socket, addr = self.server_socket.accept()
+            except OSError:
+                break
+            self.add_client(client_socket)
             print(f"Connection accepted from {addr}")
             threading.Thread(
                 target=self.handle_client,
-                args=(self.client_socket,)
+                args=(client_socket,),
+                daemon=True,
             ).start()
 
     def handle_client(self, client_socket):
@@ -49,14 +75,14 @@ class ServerSocket:
         Args:
             client_socket (socket.socket): The client socket.
         """
+        session = ClientSession()
         while self.running:
             try:
-                message = client_socket.recv(1024).decode()
-                if message:
-                    print(f"Message received: {message}")
-                    self.command = message
-                    self.process_command(message)
-                    client_socket.send(f"Command received: {message}".encode())
+                data = client_socket.recv(65536)
+                if data:
+                    reply = self.receive(session, data)
+                    if reply:
+                        client_socket.sendall(reply)
                 else:
                     print("Client closed the connection.")
                     break
@@ -64,38 +90,208 @@ class ServerSocket:
                 print(f"Error: {e}")
                 break
         client_socket.close()
-        self.connection_established = False
+        self.remove_client(client_socket)
+
+    def start_async_server(self):
+        """Run the asyncio server on its own event loop until stopped."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.stopped = asyncio.Event()
+        try:
+            self.loop.run_until_complete(self.serve())
+        except OSError as e:
+            print(f"Error starting server: {e}")
+        finally:
+            self.loop.close()
+
+    async def serve(self):
+        """Accept clients until stop() is called, then close them all."""
+        server = await asyncio.start_server(
+            self.handle_async_client, self.host, self.port, backlog=SERVER_BACKLOG
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+        print(f"Server listening on port {self.port}")
+
+        async with server:
+            await self.stopped.wait()
+
+            # Since Python 3.12 leaving the block waits for every open
+            # connection, so the clients are closed before
+            server.close()
+            with self.clients_lock:
+                tasks = list(self.clients)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def handle_async_client(self, reader, writer):
+        """Handle messages received from one client on the event loop.
+
+        Acks go through the transport buffer. When a client stops reading
+        them, drain() pauses only that client until its buffer empties.
+
+        Args:
+            reader (asyncio.StreamReader): The client stream reader.
+            writer (asyncio.StreamWriter): The client stream writer.
+        """
+        task = asyncio.current_task()
+        self.add_client(task)
+        session = ClientSession()
+        writer.transport.set_write_buffer_limits(high=SERVER_WRITE_BUFFER_BYTES)
+        print(f"Connection accepted from {writer.get_extra_info('peername')}")
+        try:
+            while self.running:
+                data = await reader.read(65536)
+                if not data:
+                    print("Client closed the connection.")
+                    break
+                reply = self.receive(session, data)
+                if reply:
+                    writer.write(reply)
+                    await writer.drain()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Error: {e}")
+        finally:
+            writer.close()
+            self.remove_client(task)
+
+    def receive(self, session: ClientSession, data: bytes) -> bytes:
+        """Queue the commands carried by the bytes read from a client.
+
+        Args:
+            session (ClientSession): The protocol state of the connection.
+            data (bytes): The bytes of one read.
+
+        Returns:
+            bytes: The acks to send back to the client.
+        """
+        commands, reply = session.receive(data)
+        for command in commands:
+            print(f"Message received: {command}")
+            self.push_command(command)
+        return reply
 
-    def register_callback(self, command: str, callback):
+    def add_client(self, client):
+        """Track a connected client.
+
+        Args:
+            client (socket.socket | asyncio.Task): The client socket or task.
+        """
+        with self.clients_lock:
+            self.clients.add(client)
+            changed = not self.connection_established
+            self.connection_established = True
+        if changed:
+            post_event(CONNECTION_CHANGED)
+
+    def remove_client(self, client):
+        """Stop tracking a disconnected client.
+
+        Args:
+            client (socket.socket | asyncio.Task): The client socket or task.
+        """
+        with self.clients_lock:
+            self.clients.discard(client)
+            changed = self.connection_established and not self.clients
+            self.connection_established = bool(self.clients)
+        if changed:
+            post_event(CONNECTION_CHANGED)
+
+    def register_callback(self, command: str, callback, takes_argument: bool = False):
         """Register a callback function for a specific command.
 
+        Commands registered with takes_argument can be sent as
+        "<command> <argument>", for example "playlist weight promo.mp4 3",
+        and their callback is called with the argument ("" if there is none).
+
         Args:
             command (str): The command to register the callback for.
             callback (function): The callback function to register.
+            takes_argument (bool): Whether the callback takes the argument.
         """
         self.command_callbacks[command] = callback
+        if takes_argument:
+            self.argument_commands.add(command)
+        else:
+            self.argument_commands.discard(command)
 
     def process_command(self, message: str):
         """Process received commands and execute callbacks.
 
+        Called by the main loop for every command taken from the queue.
+
         Args:
             message (str): The command message to process.
         """
-        if message in self.command_callbacks:
-            self.command_callbacks[message]()
+        command, _, argument = message.strip().partition(" ")
+        if command not in self.command_callbacks:
+            return
+        if command in self.argument_commands:
+            self.command_callbacks[command](argument.strip())
+        elif not argument:
+            self.command_callbacks[command]()
+
+    def push_command(self, message: str):
+        """Queue a received command and wake up the pygame event loop.
+
+        Safe to call from any thread, commands keep their arrival order.
+
+        Args:
+            message (str): The command message to queue.
+        """
+        self.commands.put(message)
+        post_event(COMMAND_RECEIVED)
 
     def get_command(self):
-        """Get the last received command.
+        """Take the next received command from the queue.
 
         Returns:
-            str: The last received command.
+            str: The oldest command not yet taken, or None if there is none.
         """
-        return self.command
+        try:
+            return self.commands.get_nowait()
+        except queue.Empty:
+            return None
+
+    def drain_commands(self) -> list[str]:
+        """Take every queued command, oldest first.
+
+        Returns:
+            list[str]: The commands received since the last call.
+        """
+        commands = []
+        while True:
+            command = self.get_command()
+            if command is None:
+                return commands
+            commands.append(command)
 
     def stop(self):
-        """Stop the server."""
+        """Stop the server and close every client connection."""
         self.running = False
-        if self.client_socket:
-            self.client_socket.close()
+        if self.mode == "asyncio":
+            if self.loop and not self.loop.is_closed():
+                try:
+                    self.loop.call_soon_threadsafe(self.stopped.set)
+                except RuntimeError:
+                    pass  # The loop finished between the check and the call
+                self.server_thread.join(timeout=5)
+            return
+
+        with self.clients_lock:
+            clients = list(self.clients)
+        for client_socket in clients:
+            try:
+                client_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            client_socket.close()
         if self.server_socket:
+            try:
+                self.server_socket.shutdown(socket.SHUT_RDWR)  # Wake up accept()
+            except OSError:
+                pass
             self.server_socket.close()